@@ -0,0 +1,601 @@
+import argparse
+import json
+import os
+import pickle
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import stdlib_array  # noqa: F401  (first: loads the real `array` module)
+
+from datatype_game.analytics import aggregates, student_trend
+from datatype_game.archive import ResultsArchive
+from datatype_game.classifier import (CONFORMANCE_CASES, FALLBACK, MATCHERS, TYPE_NAMES, check_conformance,
+                                      _classify_regex, classify, classify_many, js_rules)
+from datatype_game.export import FORMATS, write_results
+from datatype_game.datatypes import (ITEM_KINDS, check_generators, detect_type, generate_data,
+                                     generate_grid_data, generate_mix)
+from datatype_game.difficulty import DifficultyModel, student_key
+from datatype_game.leaderboard import LeaderboardIndex
+from datatype_game.memory import CELL_TYPES, MemoryArray
+from datatype_game.resources import RESULTS_FSYNC_INTERVAL
+from datatype_game.results_store import ResultsStore
+from datatype_game.round_pool import round_from_items
+from datatype_game.sorter import CONTAINERS, place_item, start_round
+from datatype_game.write_queue import ResultsWriteQueue
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+
+def _fmt_us(seconds):
+    return f"{seconds * 1e6:9.1f} us"
+
+
+# --- Save latency vs. stored history, through the write queue save_result uses ---
+def bench_save(args):
+    # Saves arrive in bursts of --burst (a class finishing together). "save"
+    # is the call on the script thread; "durable" runs from that call until
+    # wait() sees the result fsynced to the journal, so it includes the
+    # group-commit interval a student waits out before "saved" shows.
+    sizes = [10, 1_000, 100_000, 1_000_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultsStore(os.path.join(tmp, "results.db"))
+        queue = ResultsWriteQueue(os.path.join(tmp, "results.journal"), lambda room: store,
+                                  fsync_interval=RESULTS_FSYNC_INTERVAL)
+        stored = 0
+        print(f"{'stored':>10} {'save p50':>12} {'save p95':>12} {'durable p50':>12} {'durable p95':>12}")
+        for size in sizes:
+            # bulk prefill up to the next size, then time queued saves
+            store.append_many((f"player{i}", i % 21, i % 61, "2025-01-01 00:00:00") for i in range(stored, size))
+            saves, durable = [], []
+            for start in range(0, args.saves, args.burst):
+                burst = []
+                for i in range(start, min(start + args.burst, args.saves)):
+                    t0 = time.perf_counter()
+                    seq, _ = queue.save("bench", i % 21, i % 61)
+                    saves.append(time.perf_counter() - t0)
+                    burst.append((seq, t0))
+                for seq, t0 in burst:
+                    queue.wait(seq)
+                    durable.append(time.perf_counter() - t0)
+            queue.flush()  # everything inserted before the next prefill
+            stored = size + args.saves
+            saves.sort()
+            durable.sort()
+            print(f"{size:>10} {_fmt_us(statistics.median(saves))} {_fmt_us(saves[int(len(saves) * 0.95)])} "
+                  f"{statistics.median(durable) * 1e3:9.1f} ms {durable[int(len(durable) * 0.95)] * 1e3:9.1f} ms")
+        print(queue.stats())
+
+
+# --- Leaderboard top-10 read vs. stored history ---
+def bench_leaderboard(args):
+    print(f"{'stored':>10} {'rebuild':>12} {'add':>12} {'top(10)':>12}")
+    for size in [10, 1_000, 100_000, 1_000_000]:
+        records = [{"Name": f"p{i}", "Score": (i * 7919) % 21, "TimeTaken(s)": (i * 104729) % 61} for i in range(size)]
+        index = LeaderboardIndex()
+        t0 = time.perf_counter()
+        index.rebuild(records)
+        rebuild = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for i in range(args.reads):
+            index.add({"Name": "bench", "Score": i % 21, "TimeTaken(s)": i % 61})
+        add = (time.perf_counter() - t0) / args.reads
+        t0 = time.perf_counter()
+        for _ in range(args.reads):
+            index.top(10)
+        read = (time.perf_counter() - t0) / args.reads
+        print(f"{size:>10} {rebuild * 1e3:9.1f} ms {_fmt_us(add)} {_fmt_us(read)}")
+
+
+# --- On-demand results export vs. stored history ---
+def bench_export(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultsStore(os.path.join(tmp, "results.db"))
+        stored = 0
+        print(f"{'stored':>10} {'format':>8} {'all rows':>10} {'bytes':>12} {'last day':>10}")
+        for size in [1_000, 100_000, 1_000_000]:
+            # one result per minute, so the history spans years at the top size
+            store.append_many(
+                (f"player{i % 500}", i % 21, i % 61, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(1_600_000_000 + 60 * i)))
+                for i in range(stored, size)
+            )
+            stored = size
+            last_day = time.strftime("%Y-%m-%d", time.gmtime(1_600_000_000 + 60 * (size - 1)))
+            for fmt in FORMATS:
+                with open(os.path.join(tmp, "out"), "wb") as out:
+                    t0 = time.perf_counter()
+                    write_results(store, out, fmt)
+                    full = time.perf_counter() - t0
+                    nbytes = out.tell()
+                with open(os.path.join(tmp, "out"), "wb") as out:
+                    t0 = time.perf_counter()
+                    write_results(store, out, fmt, since=last_day)
+                    day = time.perf_counter() - t0
+                print(f"{size:>10} {fmt:>8} {full * 1e3:7.0f} ms {nbytes:>12,} {day * 1e3:7.1f} ms")
+
+
+# --- Archive compaction and analytics queries vs. stored history ---
+def bench_analytics(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultsStore(os.path.join(tmp, "results.db"))
+        archive = ResultsArchive(store, os.path.join(tmp, "archive"), compact_rows=10**12)
+        stored = 0
+        print(f"{'stored':>10} {'compact':>10} {'open':>10} {'aggregates':>12} {'trend':>10}")
+        for size in [10_000, 100_000, 1_000_000, 3_000_000]:
+            store.append_many(
+                (f"player{i % 500}", i % 21, i % 61, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(1_600_000_000 + 60 * i)))
+                for i in range(stored, size)
+            )
+            stored = size
+            t0 = time.perf_counter()
+            archive.compact()
+            compact = time.perf_counter() - t0
+            # a fresh archive object maps the segments from scratch, like a new process
+            t0 = time.perf_counter()
+            table = ResultsArchive(store, archive.directory, compact_rows=10**12).table()
+            opened = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            aggregates(table)
+            agg = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            student_trend(table, "player7")
+            trend = time.perf_counter() - t0
+            print(f"{size:>10} {compact * 1e3:7.0f} ms {opened * 1e3:7.1f} ms {agg * 1e3:9.1f} ms {trend * 1e3:7.1f} ms")
+
+
+# --- Per-session round state: string lists vs. ids + type codes + bitmask ---
+def _legacy_place(state, item, chosen):
+    # the original app2 placement: list search, remove and append
+    if item in state["available"]:
+        state["available"].remove(item)
+    if chosen == detect_type(item):
+        state["score"] += 1
+        state[chosen].append(item)
+        return True
+    state["available"].append(item)
+    return False
+
+
+def bench_state(args):
+    print(f"{'items':>7} {'legacy bytes':>13} {'compact bytes':>14} {'shared round':>13} {'legacy place':>13} {'compact place':>14}")
+    for size in [20, 1_000, 10_000]:
+        rng = random.Random(0)
+        items = []
+        while len(items) < size:
+            items.extend(generate_data(rng))
+        items = items[:size]
+        round_ = round_from_items(items)
+        types = [detect_type(v) for v in items]
+        order = list(range(size))
+        rng.shuffle(order)  # players do not place items in list order
+
+        legacy = {"data_items": list(items), "available": list(items), "score": 0, **{c: [] for c in CONTAINERS}}
+        t0 = time.perf_counter()
+        for i in order:
+            _legacy_place(legacy, items[i], types[i])
+        legacy_place = (time.perf_counter() - t0) / size
+
+        compact = {}
+        start_round(compact, round_)
+        t0 = time.perf_counter()
+        for i in order:
+            place_item(compact, i, types[i])
+        compact_place = (time.perf_counter() - t0) / size
+
+        # what a session holds once the round is over; the compact state
+        # shares its Round with every other session, so count it separately
+        legacy_bytes = len(pickle.dumps(legacy))
+        compact_bytes = len(pickle.dumps({k: v for k, v in compact.items() if k != "round"}))
+        print(f"{size:>7} {legacy_bytes:>13,} {compact_bytes:>14,} {len(pickle.dumps(round_)):>13,} "
+              f"{_fmt_us(legacy_place)} {_fmt_us(compact_place)}")
+
+
+# --- Adaptive difficulty: error-rate updates and per-student round mix ---
+def bench_difficulty(args):
+    rng = random.Random(0)
+    model = DifficultyModel()
+    students = [student_key(f"student{i}", f"room{i % 10}") for i in range(args.students)]
+    placements = [(rng.choice(students), rng.randrange(5), rng.random() < 0.3) for _ in range(200_000)]
+    t0 = time.perf_counter()
+    for student, code, wrong in placements:
+        model.record(student, code, wrong)
+    record = (time.perf_counter() - t0) / len(placements)
+    print(f"{len(model):,} students, {sys.getsizeof(next(iter(model._rates.values()))) + len(TYPE_NAMES) * 24} bytes of rates each")
+    print(f"record(): {_fmt_us(record)} per placement")
+
+    print(f"{'items':>7} {'mix()':>10} {'generate':>10} {'classify':>10} {'Start total':>12}")
+    for size in [20, 100, 500]:
+        timings = [[], [], []]
+        for student in students[:1000]:
+            t0 = time.perf_counter()
+            mix = model.mix(student, size)
+            t1 = time.perf_counter()
+            items = generate_mix(rng, mix)
+            t2 = time.perf_counter()
+            round_from_items(items)
+            t3 = time.perf_counter()
+            for samples, dt in zip(timings, (t1 - t0, t2 - t1, t3 - t2)):
+                samples.append(dt)
+        mix_t, gen_t, cls_t = (statistics.median(samples) for samples in timings)
+        print(f"{size:>7} {_fmt_us(mix_t)} {_fmt_us(gen_t)} {_fmt_us(cls_t)} {_fmt_us(mix_t + gen_t + cls_t):>12}")
+
+
+# --- Array model: pickled size of a MemoryArray vs. the item strings it holds ---
+def bench_memory(args):
+    print(f"{'type':>11} {'cells':>6} {'cell bytes':>11} {'pickled':>8} {'strings':>8}")
+    rng = random.Random(0)
+    for type_name in CELL_TYPES:
+        values = [str(v) for v in ITEM_KINDS[type_name][1](rng, args.cells)]
+        cells = MemoryArray.from_values(type_name, values)
+        print(f"{type_name:>11} {len(cells):>6} {cells.nbytes:>11} {len(pickle.dumps(cells)):>8} "
+              f"{len(pickle.dumps(values)):>8}")
+
+
+# --- Server CPU per round: per-item Place vs. batch submit ---
+def _play_round(batch):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(_here, "app2.py"), default_timeout=60).run()
+    at.text_input[0].input("bench").run()
+    at.button[0].click().run()
+    if batch:
+        at.toggle(key="batch_mode").set_value(True).run()
+    items = at.session_state.round.items
+    runs = 0
+    t0 = time.process_time()
+    if batch:
+        for sb in at.selectbox:
+            if sb.key.startswith("batch_"):
+                sb.set_value(detect_type(items[int(sb.key.split("_")[1])]))
+        [b for b in at.button if b.label.startswith("✅")][0].click().run()
+        runs += 1
+    else:
+        for item_id, item in enumerate(items):
+            at.selectbox(key=f"sel_{item_id}").set_value(detect_type(item))
+            at.button(key=f"btn_{item_id}").click().run()
+            runs += 1
+    cpu = time.process_time() - t0
+    assert at.session_state.score == len(items), at.session_state.score
+    return cpu, runs
+
+
+def _size_reruns(size, clicks):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(_here, "app2.py"), default_timeout=120).run()
+    at.text_input[0].input("bench").run()
+    at.selectbox(key="round_size").set_value(size).run()
+    at.button[0].click().run()
+    items = at.session_state.round.items
+    samples = []
+    for _ in range(clicks):
+        # place the first item on the page correctly, as a player would
+        item_id = int(next(b.key for b in at.button if b.key and b.key.startswith("btn_")).split("_")[1])
+        at.selectbox(key=f"sel_{item_id}").set_value(detect_type(items[item_id]))
+        t0 = time.process_time()
+        at.button(key=f"btn_{item_id}").click().run()
+        samples.append(time.process_time() - t0)
+    return statistics.median(samples), len(at.button) + len(at.selectbox)
+
+
+def bench_sizes(args):
+    # per-click rerun CPU of app2 as the round grows; only one page of the
+    # Available list becomes widgets, so this should stay flat
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            print(f"{'items':>7} {'widgets':>8} {'rerun CPU':>12}")
+            for size in [20, 500, 2_000, 10_000]:
+                cpu, widgets = _size_reruns(size, args.clicks)
+                print(f"{size:>7} {widgets:>8} {cpu * 1e3:9.1f} ms")
+        finally:
+            os.chdir(cwd)
+
+
+# --- Frontend deltas per placement: index-based vs. id-based widget keys ---
+def _legacy_available(items):
+    # the original app2 Available loop: keys come from enumerate(available),
+    # so removing an item renames every widget after it
+    import streamlit as st
+
+    from datatype_game.classifier import classify
+
+    if "available" not in st.session_state:
+        st.session_state.available = list(items)
+    for idx, item in enumerate(st.session_state.available.copy()):
+        cols = st.columns([2, 1])
+        cols[0].markdown(f"**{item}**")
+        target = cols[1].selectbox("Container", options=["integers", "reals", "characters", "booleans", "strings"],
+                                   index=0, key=f"sel_{idx}_{item}", label_visibility="collapsed")
+        if st.button("Place", key=f"btn_{idx}_{item}"):
+            st.session_state.available.remove(item)
+            if target != classify(item):
+                st.session_state.available.append(item)
+            st.rerun()
+
+
+def _stable_available(items):
+    # the same loop over sorter's id-keyed state (see sorter.run)
+    import streamlit as st
+
+    from datatype_game.round_pool import round_from_items
+    from datatype_game.sorter import CONTAINERS, available_page, place_item, start_round
+
+    if "round" not in st.session_state:
+        start_round(st.session_state, round_from_items(items))
+    for item_id in available_page(st.session_state, 0):
+        cols = st.columns([2, 1])
+        cols[0].markdown(f"**{st.session_state.round.items[item_id]}**")
+        target = cols[1].selectbox("Container", options=CONTAINERS, index=0, key=f"sel_{item_id}", label_visibility="collapsed")
+        if st.button("Place", key=f"btn_{item_id}"):
+            place_item(st.session_state, item_id, target)
+            st.rerun()
+
+
+def _widget_ids(msgs):
+    # widget id -> delta path, for the new elements in a batch of ForwardMsgs
+    ids = {}
+    for msg in msgs:
+        if msg.WhichOneof("type") != "delta":
+            continue
+        element = msg.delta.new_element
+        kind = element.WhichOneof("type")
+        inner = getattr(element, kind) if kind else None
+        if inner is not None and "id" in inner.DESCRIPTOR.fields_by_name and inner.id:
+            ids[inner.id] = tuple(msg.metadata.delta_path)
+    return ids
+
+
+def _placement_deltas(at, placements, place_first):
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+    sent = []
+
+    def record(msg):
+        copy = type(msg)()
+        copy.CopyFrom(msg)
+        sent.append(copy)
+
+    def last_run(msgs):
+        # A click that calls st.rerun() sends two script runs and the browser
+        # ends up showing the second. Within a run the top-level element
+        # index never decreases, so a run starts wherever it goes backwards.
+        start, prev = 0, ()
+        for i, msg in enumerate(msgs):
+            top = tuple(msg.metadata.delta_path[:2])
+            if top < prev:
+                start = i
+            prev = top
+        return msgs[start:]
+
+    # every ForwardMsg the script sends, as it would go to the browser
+    ForwardMsgQueue.on_before_enqueue_msg(record)
+    try:
+        at.run()
+        before = _widget_ids(last_run([m for m in sent if m.WhichOneof("type") == "delta"]))
+        rows = []
+        for _ in range(placements):
+            sent.clear()
+            place_first(at)
+            deltas = [m for m in sent if m.WhichOneof("type") == "delta"]
+            after = _widget_ids(last_run(deltas))
+            remounted = sum(1 for wid in after if wid not in before)
+            moved = sum(1 for wid, path in after.items() if wid in before and before[wid] != path)
+            rows.append((len(deltas), sum(m.ByteSize() for m in deltas), len(after), remounted, moved))
+            before = after
+    finally:
+        ForwardMsgQueue.on_before_enqueue_msg(None)
+    return rows
+
+
+def bench_deltas(args):
+    from streamlit.testing.v1 import AppTest
+
+    items = generate_data(random.Random(0))
+
+    def place_first(item_of):
+        # correctly place the top item of the list, as a player would
+        def place(at):
+            sb = at.selectbox[0]
+            sb.set_value(detect_type(item_of(sb.key)))
+            next(b for b in at.button if b.label == "Place").click().run()
+        return place
+
+    print(f"{'keys':>10} {'deltas':>8} {'bytes':>8} {'widgets':>8} {'remounted':>10} {'moved':>6}   (median per placement)")
+    for label, script, item_of in [
+        ("index", _legacy_available, lambda key: key.split("_", 2)[2]),
+        ("item id", _stable_available, lambda key: items[int(key.split("_")[1])]),
+    ]:
+        at = AppTest.from_function(script, args=(items,), default_timeout=60)
+        rows = _placement_deltas(at, args.placements, place_first(item_of))
+        cols = [statistics.median(col) for col in zip(*rows)]
+        print(f"{label:>10} {cols[0]:>8.0f} {cols[1]:>8,.0f} {cols[2]:>8.0f} {cols[3]:>10.0f} {cols[4]:>6.0f}")
+
+
+def bench_rounds(args):
+    # runs app2.py under Streamlit's AppTest in a scratch directory so the
+    # benchmark never touches the real results store
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(os.path.join(_here, "results.csv"), tmp)
+        os.chdir(tmp)
+        try:
+            print(f"{'mode':>10} {'script runs':>12} {'CPU/round':>12}")
+            for label, batch in [("per-item", False), ("batch", True)]:
+                samples = [_play_round(batch) for _ in range(args.rounds)]
+                cpu = statistics.median(c for c, _ in samples)
+                print(f"{label:>10} {samples[0][1]:>12} {cpu * 1e3:9.1f} ms")
+        finally:
+            os.chdir(cwd)
+
+
+# --- Classifier conformance and throughput ---
+def _legacy_detect_type(value):
+    # the original try/except detect_type from app2.py, kept for comparison
+    if value in ["True", "False"]:
+        return "booleans"
+    try:
+        if "." in value:
+            float(value)
+            return "reals"
+        else:
+            int(value)
+            return "integers"
+    except ValueError:
+        if len(value) == 1 and value.isalpha():
+            return "characters"
+        return "strings"
+
+
+def _js_conformance():
+    with open(os.path.join(_here, "datatype_game", "drop_grid_frontend", "classify.js"), encoding="utf-8") as f:
+        script = f.read() + (
+            f"setTypeRules({json.dumps(js_rules())});\n"
+            f"const cases = {json.dumps(CONFORMANCE_CASES)};\n"
+            "const bad = cases.filter(([v, t]) => classifyValue(v) !== t).map(([v, t]) => [v, t, classifyValue(v)]);\n"
+            "console.log(JSON.stringify(bad));\n"
+        )
+    try:
+        out = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return json.loads(out)
+
+
+def bench_classify(args):
+    py_bad = check_conformance()
+    js_bad = _js_conformance()
+    print(f"conformance: {len(CONFORMANCE_CASES)} cases, python mismatches={py_bad}, "
+          f"js mismatches={'node not found' if js_bad is None else js_bad}")
+
+    rng = random.Random(0)
+    pool = [str(rng.randint(-999, 999)) for _ in range(50)] + [f"{rng.uniform(-99, 99):.2f}" for _ in range(50)]
+    pool += list("ABCDEFGHIJ") + ["True", "False", "Hello", "IB", "Code", "CS", "Data", "1e3", ".5"]
+    values = [rng.choice(pool) for _ in range(args.values)]
+    unique = [f"{i}.{i % 97}" if i % 2 else str(i) for i in range(args.values)]
+
+    def rate(fn, data):
+        t0 = time.perf_counter()
+        fn(data)
+        return len(data) / (time.perf_counter() - t0)
+
+    print(f"{'variant':>28} {'values/s':>14}")
+    print(f"{'legacy try/except':>28} {rate(lambda d: [_legacy_detect_type(v) for v in d], values):14,.0f}")
+    _classify_regex.cache_clear()
+    print(f"{'classify, all unique (cold)':>28} {rate(lambda d: [classify(v) for v in d], unique):14,.0f}")
+    _classify_regex.cache_clear()
+    print(f"{'classify_many, game values':>28} {rate(classify_many, values):14,.0f}")
+
+    # per item kind, uncached: one combined regex vs. trying each type's matcher in turn
+    bad = check_generators(rng)
+    print(f"\ngenerators: {len(ITEM_KINDS)} kinds, misclassified={bad[:5]}")
+    n = max(1, args.values // 10)
+
+    def best(fn, data):
+        return max(rate(fn, data) for _ in range(3))
+
+    def chained(value):
+        return next((name for name, matcher in MATCHERS.items() if matcher.fullmatch(value)), FALLBACK)
+
+    print(f"{'kind':>13} {'type':>13} {'generate/s':>12} {'own matcher/s':>14} {'combined/s':>12} {'chained/s':>12} "
+          f"{'classify/s':>12}")
+    for kind, (type_name, generate) in ITEM_KINDS.items():
+        t0 = time.perf_counter()
+        data = [str(v) for v in generate(rng, n)]
+        generated = n / (time.perf_counter() - t0)
+        own = MATCHERS.get(type_name)
+        own_rate = f"{best(lambda d: [own.fullmatch(v) for v in d], data):14,.0f}" if own else f"{'(fallback)':>14}"
+        print(f"{kind:>13} {type_name:>13} {generated:12,.0f} {own_rate} "
+              f"{best(lambda d: [_classify_regex.__wrapped__(v) for v in d], data):12,.0f} "
+              f"{best(lambda d: [chained(v) for v in d], data):12,.0f} "
+              f"{best(lambda d: [classify(v) for v in d], data):12,.0f}")
+
+
+# --- Grid page render cost and payload per rerun ---
+def _inline_page(template, items):
+    # what every rerun used to do: build the whole page (CSS, markup, JS and
+    # items) in Python and ship it through st.components.v1.html
+    items_html = "".join(f'<div id="item-{i}" class="item" draggable="true" ondragstart="drag(event)">{v}</div>' for i, v in enumerate(items))
+    rules = f"<script>setTypeRules({json.dumps(js_rules())});</script>"
+    return template.replace('<h3>🎯 Available Data</h3>', '<h3>🎯 Available Data</h3>' + items_html, 1) + rules
+
+
+def bench_render(args):
+    pages_dir = os.path.join(_here, "datatype_game", "drop_grid_frontend", "pages")
+    items = generate_grid_data()
+    print(f"{'page':>16} {'before bytes':>13} {'after bytes':>12} {'before':>12} {'after':>12}")
+    for page in sorted(os.path.splitext(f)[0] for f in os.listdir(pages_dir)):
+        with open(os.path.join(pages_dir, page + ".html"), encoding="utf-8") as f:
+            template = f.read()
+        t0 = time.perf_counter()
+        for _ in range(args.reruns):
+            html = _inline_page(template, items)
+        before = (time.perf_counter() - t0) / args.reruns
+        t0 = time.perf_counter()
+        for _ in range(args.reruns):
+            payload = json.dumps({"page": page, "items": list(items), "rules": js_rules(), "height": 700})
+        after = (time.perf_counter() - t0) / args.reruns
+        print(f"{page:>16} {len(html.encode()):>13} {len(payload.encode()):>12} {_fmt_us(before)} {_fmt_us(after)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DatatypeGame micro-benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("save", help="queued save and durable-acknowledgement latency, 10 to 1,000,000 stored results")
+    p.add_argument("--saves", type=int, default=200)
+    p.add_argument("--burst", type=int, default=30, help="saves arriving together")
+    p.set_defaults(func=bench_save)
+
+    p = sub.add_parser("leaderboard", help="leaderboard index rebuild, add and top-10 read cost")
+    p.add_argument("--reads", type=int, default=10_000)
+    p.set_defaults(func=bench_leaderboard)
+
+    p = sub.add_parser("export", help="results export time and size per format, whole history vs. one day")
+    p.set_defaults(func=bench_export)
+
+    p = sub.add_parser("analytics", help="archive compaction, open and aggregate query time up to 3,000,000 results")
+    p.set_defaults(func=bench_analytics)
+
+    p = sub.add_parser("state", help="per-session round state size and placement cost, string lists vs. compact")
+    p.set_defaults(func=bench_state)
+
+    p = sub.add_parser("memory", help="pickled size of a MemoryArray per cell type vs. a list of its item strings")
+    p.add_argument("--cells", type=int, default=20)
+    p.set_defaults(func=bench_memory)
+
+    p = sub.add_parser("difficulty", help="adaptive difficulty: error-rate update cost and per-student round build at Start")
+    p.add_argument("--students", type=int, default=10_000)
+    p.set_defaults(func=bench_difficulty)
+
+    p = sub.add_parser("sizes", help="app2 rerun CPU per Place click for rounds of 20 to 10,000 items")
+    p.add_argument("--clicks", type=int, default=10)
+    p.set_defaults(func=bench_sizes)
+
+    p = sub.add_parser("deltas", help="frontend deltas and widget remounts per Place click, index vs. id widget keys")
+    p.add_argument("--placements", type=int, default=10)
+    p.set_defaults(func=bench_deltas)
+
+    p = sub.add_parser("rounds", help="app2 server CPU per full round, per-item vs. batch mode")
+    p.add_argument("--rounds", type=int, default=3)
+    p.set_defaults(func=bench_rounds)
+
+    p = sub.add_parser("classify", help="classifier conformance (Python and JS) and values/second, overall and per item kind")
+    p.add_argument("--values", type=int, default=200_000)
+    p.set_defaults(func=bench_classify)
+
+    p = sub.add_parser("render", help="grid page build time and bytes shipped per rerun, inline page vs. cached template")
+    p.add_argument("--reruns", type=int, default=2_000)
+    p.set_defaults(func=bench_render)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
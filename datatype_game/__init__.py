@@ -0,0 +1,6 @@
+from .modes import MODES, GameMode, navigation, register_mode, run_mode
+
+# importing the mode modules registers the built-in game modes
+from . import grid, indexing, sorter  # noqa: E402,F401
+# the teacher page goes last so a game stays the default page
+from . import analytics  # noqa: E402,F401
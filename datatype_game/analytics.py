@@ -0,0 +1,126 @@
+import time
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+
+from .modes import register_mode
+from .resources import get_archive, list_rooms
+
+# Teacher-facing results analytics over the columnar archive. The queries are
+# plain pyarrow compute kernels over the memory-mapped table, cached per
+# archive version, so a page view after the first costs a dictionary lookup.
+
+PERCENTILES = [0.5, 0.75, 0.9, 0.95, 0.99]
+
+
+# --- Aggregate queries (no widgets, so bench.py can time them) ---
+def _grouped(table, key, aggs, names):
+    # group_by output column order differs between pyarrow versions, so pick by name
+    result = table.group_by(key).aggregate(aggs)
+    return result.select([key] + [f"{column}_{fn}" for column, fn in aggs]).rename_columns(names)
+
+
+def aggregates(table):
+    scores, times = table["Score"], table["TimeTaken(s)"]
+    distribution = _grouped(table, "Score", [("Score", "count")], ["Score", "Rounds"]).sort_by("Score")
+    percentiles = pa.table({
+        "Percentile": [f"p{int(q * 100)}" for q in PERCENTILES],
+        "TimeTaken(s)": pc.quantile(times, q=PERCENTILES) if len(times) else pa.nulls(len(PERCENTILES), pa.float64()),
+    })
+    students = _grouped(
+        table,
+        "Name",
+        [("Score", "count"), ("Score", "mean"), ("Score", "max"), ("TimeTaken(s)", "mean"), ("Timestamp", "max")],
+        ["Name", "Rounds", "Mean score", "Best score", "Mean time (s)", "Last played"],
+    )
+    return {
+        "rows": table.num_rows,
+        "students": students.num_rows,
+        "mean_score": pc.mean(scores).as_py(),
+        "distribution": distribution,
+        "percentiles": percentiles,
+        "students_table": students.sort_by([("Rounds", "descending"), ("Name", "ascending")]),
+    }
+
+
+def student_trend(table, name):
+    # one student's mean score and time per day
+    rows = table.filter(pc.equal(table["Name"], name))
+    days = pc.floor_temporal(rows["Timestamp"], unit="day")
+    daily = pa.table({"Day": days, "Score": rows["Score"], "TimeTaken(s)": rows["TimeTaken(s)"]})
+    return _grouped(daily, "Day", [("Score", "mean"), ("TimeTaken(s)", "mean")], ["Day", "Mean score", "Mean time (s)"]).sort_by("Day")
+
+
+# --- Cached per archive version ---
+ALL_ROOMS = None  # room selector value that concatenates every room's archive
+
+
+def _rooms(room):
+    return list_rooms() if room is ALL_ROOMS else [room]
+
+
+def _table(room):
+    return pa.concat_tables([get_archive(r).table() for r in _rooms(room)])
+
+
+def _version(room):
+    return tuple(get_archive(r).version() for r in _rooms(room))
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_aggregates(room, version):
+    t0 = time.perf_counter()
+    result = aggregates(_table(room))
+    result = {k: v.to_pandas() if isinstance(v, pa.Table) else v for k, v in result.items()}
+    result["seconds"] = time.perf_counter() - t0
+    return result
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_trend(room, version, name):
+    return student_trend(_table(room), name).to_pandas()
+
+
+def run():
+    st.title("📈 Results Analytics")
+    room = st.selectbox(
+        "Room",
+        list_rooms() + [ALL_ROOMS],
+        format_func=lambda r: "All rooms" if r is ALL_ROOMS else r or "(no room code)",
+    )
+    version = _version(room)
+    t0 = time.perf_counter()
+    result = _cached_aggregates(room, version)
+    archived = sum(get_archive(r).archived_through for r in _rooms(room))
+    st.caption(
+        f"{result['rows']:,} results ({archived:,} archived). "
+        f"Aggregates computed in {result['seconds'] * 1e3:.1f} ms, served in {(time.perf_counter() - t0) * 1e3:.1f} ms."
+    )
+    if not result["rows"]:
+        st.info("No results yet. Play a round to generate some.")
+        return
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Rounds played", f"{result['rows']:,}")
+    m2.metric("Students", f"{result['students']:,}")
+    m3.metric("Mean score", f"{result['mean_score']:.2f}")
+
+    c1, c2 = st.columns([2, 1])
+    with c1:
+        st.subheader("Score distribution")
+        st.bar_chart(result["distribution"], x="Score", y="Rounds")
+    with c2:
+        st.subheader("Completion time")
+        st.dataframe(result["percentiles"], hide_index=True)
+
+    st.subheader("Students")
+    st.dataframe(result["students_table"], hide_index=True)
+
+    name = st.selectbox("Student trend", result["students_table"]["Name"], index=None, placeholder="Choose a student")
+    if name is not None:
+        trend = _cached_trend(room, version, name)
+        st.line_chart(trend, x="Day", y=["Mean score", "Mean time (s)"])
+
+
+register_mode("results_analytics", "Results Analytics", "📈", run)
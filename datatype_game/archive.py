@@ -0,0 +1,144 @@
+import glob
+import math
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("Name", pa.string()),
+    ("Score", pa.int64()),
+    ("TimeTaken(s)", pa.int64()),
+    ("Timestamp", pa.timestamp("s")),
+])
+
+
+def rows_to_table(rows):
+    # (id, name, score, time_taken, timestamp) tuples from ResultsStore.rows_after
+    ids, names, scores, times, stamps = zip(*rows) if rows else ((), (), (), (), ())
+    return pa.table([
+        pa.array(ids, pa.int64()),
+        pa.array(names, pa.string()),
+        pa.array(scores, pa.int64()),
+        pa.array(times, pa.int64()),
+        pc.strptime(pa.array(stamps, pa.string()), format="%Y-%m-%d %H:%M:%S", unit="s", error_is_null=True),
+    ], schema=SCHEMA)
+
+
+class ResultsArchive:
+    # Columnar copy of the results table for analytics. SQLite stays the
+    # write path (one INSERT per save); every `compact_rows` saves a
+    # background compaction moves the new rows into an uncompressed Arrow IPC
+    # segment, part-<first id>-<last id>.arrow, which is read back through a
+    # memory map without copying. Segments are merged by size tier (tier =
+    # floor(log base `merge_fanout` of the rows a segment spans)): whenever
+    # the newest `merge_fanout` segments share a tier they become one segment
+    # of the next tier up. A row is therefore rewritten about once per tier,
+    # O(log n) times, and reads open (merge_fanout - 1) files per tier.
+    # The directory listing is the only state: a segment appears atomically
+    # (os.replace), and a merge interrupted before deleting its inputs leaves
+    # segments that the merged one covers, which are skipped.
+
+    def __init__(self, store, directory="results_archive", compact_rows=1000, merge_fanout=4, segment_rows=1_000_000):
+        self.store = store
+        self.directory = directory
+        self.compact_rows = compact_rows
+        self.merge_fanout = merge_fanout
+        self.segment_rows = segment_rows
+        self.merged_rows = 0  # rows rewritten by merges, for bench.py
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()  # one compaction at a time
+        self._thread = None
+        self._tables = {}  # segment path -> memory-mapped table
+        self._segments = self._scan()
+        self._pending = store.max_id() - self.archived_through
+        self.maybe_compact(0)
+
+    def _scan(self):
+        segments = []
+        for path in glob.glob(os.path.join(self.directory, "part-*.arrow")):
+            first, last = os.path.basename(path)[5:-6].split("-")
+            segments.append((int(first), int(last), path))
+        kept = []
+        for segment in sorted(segments, key=lambda s: (s[0], -s[1])):
+            if kept and segment[1] <= kept[-1][1]:
+                continue
+            kept.append(segment)
+        return kept
+
+    @property
+    def archived_through(self):
+        segments = self._segments
+        return segments[-1][1] if segments else 0
+
+    def maybe_compact(self, saved=1):
+        # called by save_result; starts a compaction once enough rows are waiting
+        self._pending += saved
+        if self._pending >= self.compact_rows and not (self._thread and self._thread.is_alive()):
+            self._thread = threading.Thread(target=self.compact, name="results-compaction", daemon=True)
+            self._thread.start()
+
+    def compact(self):
+        with self._lock:
+            self._pending = 0
+            while True:
+                rows = self.store.rows_after(self.archived_through, self.segment_rows)
+                if not rows:
+                    break
+                self._write([rows_to_table(rows)])
+            self._merge_tiers()
+
+    def _write(self, tables):
+        first, last = tables[0]["id"][0].as_py(), tables[-1]["id"][-1].as_py()
+        path = os.path.join(self.directory, f"part-{first:012d}-{last:012d}.arrow")
+        with pa.OSFile(path + ".tmp", "wb") as sink, pa.ipc.new_file(sink, SCHEMA) as writer:
+            for table in tables:
+                writer.write_table(table, max_chunksize=65536)
+        os.replace(path + ".tmp", path)
+        self._segments = self._scan()
+        return path
+
+    def _tier(self, segment):
+        first, last, _ = segment
+        return int(math.log(last - first + 1, self.merge_fanout))
+
+    def _merge_tiers(self):
+        while len(self._segments) >= self.merge_fanout:
+            newest = self._segments[-self.merge_fanout:]
+            if len({self._tier(s) for s in newest}) != 1:
+                break
+            self._merge(newest)
+
+    def _merge(self, segments):
+        # contiguous segments into one; the merged segment covers them, so _scan skips them if a delete is lost
+        tables = [self._read(path) for _, _, path in segments]
+        self._write(tables)
+        self.merged_rows += sum(t.num_rows for t in tables)
+        for _, _, path in segments:
+            self._tables.pop(path, None)
+            os.remove(path)
+
+    def _read(self, path):
+        table = self._tables.get(path)
+        if table is None:
+            table = self._tables[path] = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        return table
+
+    def version(self):
+        # changes whenever table() would return different rows
+        return self.archived_through, self.store.max_id()
+
+    def table(self):
+        # archived segments plus the rows saved since the last compaction
+        while True:
+            segments = self._segments
+            try:
+                tables = [self._read(path) for _, _, path in segments]
+                break
+            except FileNotFoundError:
+                continue  # merged away while reading; take the new listing
+        through = segments[-1][1] if segments else 0
+        tables.append(rows_to_table(self.store.rows_after(through)))
+        return pa.concat_tables(tables)
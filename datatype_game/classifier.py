@@ -0,0 +1,145 @@
+import re
+from functools import lru_cache
+
+# --- Rule table ---
+# Single source of truth for "what type is this value?". Rules are tried in
+# order and must match the whole value; anything that matches none is a
+# string. The patterns stick to syntax that means the same thing in Python's
+# `re` and in JavaScript (ASCII [0-9] rather than \d, no named groups), so the
+# browser pages and the server score drops identically.
+# To add a type, add its rule here and its generator to datatypes.ITEM_KINDS;
+# the combined regex, the JavaScript rules and the type codes follow.
+RULES = [
+    ("booleans", r"True|False"),
+    ("integers", r"[-+]?[0-9]+"),
+    ("reals", r"[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?|[-+]?[0-9]+[eE][-+]?[0-9]+"),
+    ("characters", r"[A-Za-z]"),
+    # extended catalogue; none of these overlap the five above
+    ("nulls", r"None|null"),
+    ("hexadecimals", r"0[xX][0-9A-Fa-f]+"),
+    ("binaries", r"0[bB][01]+"),
+    ("dates", r"[0-9]{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12][0-9]|3[01])"),
+    ("lists", r"\[ *(?:[^\[\],]+(?: *, *[^\[\],]+)*)? *\]"),
+]
+FALLBACK = "strings"
+
+# one-byte type codes, for rounds stored as a bytes object of codes
+TYPE_NAMES = [name for name, _ in RULES] + [FALLBACK]
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+# one compiled matcher per type, for checking generators and timing each type
+MATCHERS = {name: re.compile(pattern) for name, pattern in RULES}
+
+# one combined regex: the first alternative that matches the full value wins
+_COMBINED = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in RULES))
+
+
+# Fast path for the values most rounds are made of: the literal words,
+# single letters, plain integers and plain decimals. It answers only when the
+# answer is certain under RULES (ASCII digits only, so "1_000", "٣" and " 3"
+# still reach the regex) and skips the cache, which costs more than these
+# checks; everything else goes through _COMBINED once and is cached.
+_LITERALS = {"True": "booleans", "False": "booleans", "None": "nulls", "null": "nulls"}
+
+
+def classify(value):
+    kind = _LITERALS.get(value)
+    if kind or not value.isascii():
+        return kind or _classify_regex(value)
+    if len(value) == 1 and value.isalpha():
+        return "characters"
+    body = value[1:] if value[:1] in "+-" else value
+    if body.isdigit():
+        return "integers"
+    whole, dot, frac = body.partition(".")
+    if dot and (whole or frac) and (not whole or whole.isdigit()) and (not frac or frac.isdigit()):
+        return "reals"
+    return _classify_regex(value)
+
+
+@lru_cache(maxsize=65536)
+def _classify_regex(value):
+    m = _COMBINED.fullmatch(value)
+    return m.lastgroup if m else FALLBACK
+
+
+def classify_many(values):
+    # Classifies a whole round at once: each distinct value is classified
+    # once, so repeats ("True", "CS", ...) cost a dict lookup.
+    kinds = {value: classify(value) for value in set(values)}
+    return list(map(kinds.__getitem__, values))
+
+
+@lru_cache(maxsize=None)
+def js_rules():
+    # RULES as anchored JavaScript patterns, for drop_grid_frontend/classify.js
+    return [[name, f"^(?:{pattern})$"] for name, pattern in RULES]
+
+
+# --- Conformance corpus ---
+# (value, expected type). Run against both classify() and classify.js
+# by `python bench.py classify`.
+CONFORMANCE_CASES = [
+    ("True", "booleans"),
+    ("False", "booleans"),
+    ("true", "strings"),
+    ("TRUE", "strings"),
+    ("0", "integers"),
+    ("42", "integers"),
+    ("-3", "integers"),
+    ("+7", "integers"),
+    ("007", "integers"),
+    ("3.14", "reals"),
+    ("-2.5", "reals"),
+    (".5", "reals"),
+    ("-.5", "reals"),
+    ("5.", "reals"),
+    ("1e3", "reals"),
+    ("1E-3", "reals"),
+    ("-2.5e+10", "reals"),
+    ("A", "characters"),
+    ("z", "characters"),
+    ("AB", "strings"),
+    ("CS", "strings"),
+    ("Hello", "strings"),
+    ("", "strings"),
+    (" ", "strings"),
+    (" 3", "strings"),
+    ("3 ", "strings"),
+    ("1_000", "strings"),
+    ("1,5", "strings"),
+    ("inf", "strings"),
+    ("nan", "strings"),
+    ("-", "strings"),
+    (".", "strings"),
+    ("e3", "strings"),
+    ("1e", "strings"),
+    ("é", "strings"),
+    ("٣", "strings"),
+    ("3\n", "strings"),
+    ("None", "nulls"),
+    ("null", "nulls"),
+    ("none", "strings"),
+    ("NULL", "strings"),
+    ("0x1F", "hexadecimals"),
+    ("0XFF", "hexadecimals"),
+    ("0x", "strings"),
+    ("0xG", "strings"),
+    ("0b101", "binaries"),
+    ("0B0", "binaries"),
+    ("0b2", "strings"),
+    ("2024-05-01", "dates"),
+    ("1999-12-31", "dates"),
+    ("2024-13-01", "strings"),
+    ("2024-5-1", "strings"),
+    ("[]", "lists"),
+    ("[1, 2, 3]", "lists"),
+    ("[ 'a','b' ]", "lists"),
+    ("[1,]", "strings"),
+    ("[[1]]", "strings"),
+    ("[1, 2", "strings"),
+]
+
+
+def check_conformance(fn=classify):
+    return [(value, expected, fn(value)) for value, expected in CONFORMANCE_CASES if fn(value) != expected]
@@ -0,0 +1,173 @@
+from functools import lru_cache
+
+from .datatypes import detect_type
+from .drop_grid import new_events
+
+# Server-side capacity-limited containers for the drag-and-drop grids. The
+# browser only reports drops; what a container accepts, where each item ends
+# up and its index all come from here and are sent back with the next render.
+
+# policy -> what a push into a full container does
+POLICIES = {
+    "reject": "Reject: a full container refuses the item",
+    "grow": "Grow ×2: copy everything into a block twice the size",
+    "ring": "Ring buffer: overwrite the oldest item",
+}
+
+
+class CapacityContainer:
+    # A block of `capacity` slots and a count, like an array with a length.
+    # In a ring buffer the oldest item sits in slot `head` and logical index
+    # i lives in slot (head + i) % capacity. Growing copies every stored item
+    # into the new block and counts them in `copies`, which is what makes
+    # copies / pushes the amortized cost of a push. `increment` grows by a
+    # fixed number of slots instead of doubling, for comparison.
+
+    def __init__(self, capacity, policy="reject", increment=None):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown overflow policy {policy!r}")
+        if capacity < 1:
+            raise ValueError("a container needs at least one slot")
+        self.policy = policy
+        self.increment = increment
+        self.slots = [None] * capacity
+        self.head = 0
+        self.count = 0
+        self.pushes = 0  # items stored, including overwrites
+        self.copies = 0  # items copied by growth
+        self.grows = 0
+        self.shifts = 0  # items moved left to close the gap of a removal
+        self.rejects = 0
+        self.overwrites = 0
+
+    @property
+    def capacity(self):
+        return len(self.slots)
+
+    def slot(self, index):
+        return (self.head + index) % self.capacity
+
+    def items(self):
+        return [self.slots[self.slot(i)] for i in range(self.count)]
+
+    def push(self, item):
+        # ("push", None), ("grow", (old capacity, new capacity, copies)),
+        # ("overwrite", evicted item) or ("reject", None)
+        result = ("push", None)
+        if self.count == self.capacity:
+            if self.policy == "reject":
+                self.rejects += 1
+                return "reject", None
+            if self.policy == "ring":
+                evicted = self.slots[self.head]
+                self.slots[self.head] = item
+                self.head = (self.head + 1) % self.capacity
+                self.pushes += 1
+                self.overwrites += 1
+                return "overwrite", evicted
+            result = ("grow", self._grow())
+        self.slots[self.slot(self.count)] = item
+        self.count += 1
+        self.pushes += 1
+        return result
+
+    def _grow(self):
+        old = self.capacity
+        new = old + self.increment if self.increment else old * 2
+        self.slots = self.items() + [None] * (new - self.count)
+        self.head = 0
+        self.copies += self.count
+        self.grows += 1
+        return old, new, self.count
+
+    def remove(self, item):
+        items = self.items()
+        index = items.index(item)
+        del items[index]
+        self.shifts += len(items) - index
+        self.slots = items + [None] * (self.capacity - len(items))
+        self.head = 0
+        self.count = len(items)
+        return index
+
+    def stats(self):
+        return {"Count": self.count, "Capacity": self.capacity, "Policy": self.policy, "Pushes": self.pushes,
+                "Grows": self.grows, "Copies": self.copies,
+                "Copies per push": round(self.copies / self.pushes, 2) if self.pushes else 0.0,
+                "Shifts": self.shifts, "Rejected": self.rejects, "Overwritten": self.overwrites}
+
+
+class CapacityBoard:
+    # One page's containers plus where every item is. apply() takes a drop
+    # batch from the drop_grid component ({"token", "seq", "events"}) and
+    # applies each drop once, by (page token, drop number): the token changes
+    # whenever the page reloads, but the board, not the page, is what holds
+    # the placements.
+
+    def __init__(self, containers):
+        self.containers = containers  # type name -> CapacityContainer
+        self.location = {}  # item index -> container it is stored in
+        self.token = None
+        self.seq = 0
+        self.wrong = 0
+        self.events = []  # outcome of the last batch: [kind, item, container]
+
+    def apply(self, batch, items):
+        if not batch:
+            return False
+        if batch["token"] != self.token:
+            self.token, self.seq = batch["token"], 0
+        if batch["seq"] <= self.seq:
+            return False
+        events = new_events(batch, self.seq)
+        self.seq = batch["seq"]
+        self.events = []
+        for item, target, _ in events:
+            if not 0 <= item < len(items) or self.location.get(item) == target:
+                continue
+            current = self.location.pop(item, None)
+            if current is not None:
+                self.containers[current].remove(item)
+            if target not in self.containers:
+                self.events.append(["available", item, target])
+            elif detect_type(items[item]) != target:
+                self.wrong += 1
+                self.events.append(["wrong", item, target])
+            else:
+                self._push(item, target)
+        return True
+
+    def _push(self, item, target):
+        kind, detail = self.containers[target].push(item)
+        if kind == "reject":
+            self.events.append(["reject", item, target])
+            return
+        self.location[item] = target
+        if kind == "overwrite":
+            del self.location[detail]
+            self.events.append(["overwrite", detail, target])
+        self.events.append(["grow" if kind == "grow" else "push", item, target])
+
+    def placed(self):
+        return len(self.location)
+
+    def view(self):
+        # what the page needs to redraw: contents in index order, fill levels, last outcomes
+        return {
+            "containers": {name: c.items() for name, c in self.containers.items()},
+            "capacity": {name: [c.count, c.capacity, c.policy] for name, c in self.containers.items()},
+            "events": self.events,
+            "seq": self.seq,
+        }
+
+
+@lru_cache(maxsize=8)
+def growth_costs(pushes=256):
+    # total items copied after n pushes, doubling vs. growing one slot at a time
+    doubling, by_one = CapacityContainer(1, "grow"), CapacityContainer(1, "grow", increment=1)
+    rows = []
+    for n in range(1, pushes + 1):
+        doubling.push(n)
+        by_one.push(n)
+        rows.append({"Pushes": n, "Grow ×2": doubling.copies, "Grow +1": by_one.copies})
+    return rows
@@ -0,0 +1,84 @@
+import datetime
+import random
+import string
+
+from .classifier import classify
+
+
+def _integers(rng, n):
+    return rng.sample(range(1, 100), n) if n <= 99 else [rng.randint(1, 99) for _ in range(n)]
+
+def _characters(rng, n):
+    return rng.sample(string.ascii_uppercase, n) if n <= 26 else [rng.choice(string.ascii_uppercase) for _ in range(n)]
+
+def _date(rng):
+    return (datetime.date(2000, 1, 1) + datetime.timedelta(days=rng.randrange(10_000))).isoformat()
+
+def _list(rng):
+    return "[" + ", ".join(str(rng.randint(0, 9)) for _ in range(rng.randint(0, 4))) + "]"
+
+# --- Item kinds ---
+# kind -> (classifier type it must classify as, generate(rng, n) -> n values).
+# Rounds generate kinds in this order, so seeded classic rounds depend on the
+# first five staying first and unchanged; new kinds go at the end. A kind can
+# feed an existing type (negatives are integers) or one of the extended types
+# in classifier.RULES.
+ITEM_KINDS = {
+    "integers": ("integers", _integers),
+    "reals": ("reals", lambda rng, n: [round(rng.uniform(1, 99), 2) for _ in range(n)]),
+    "characters": ("characters", _characters),
+    "booleans": ("booleans", lambda rng, n: [rng.choice(["True", "False"]) for _ in range(n)]),
+    "strings": ("strings", lambda rng, n: [rng.choice(["Hello", "IB", "Code", "CS", "Data"]) for _ in range(n)]),
+    "negatives": ("integers", lambda rng, n: [-rng.randint(1, 99) for _ in range(n)]),
+    "scientific": ("reals", lambda rng, n: [f"{rng.uniform(1, 9.99):.2f}e{rng.randint(-5, 5)}" for _ in range(n)]),
+    "nulls": ("nulls", lambda rng, n: [rng.choice(["None", "null"]) for _ in range(n)]),
+    "hexadecimals": ("hexadecimals", lambda rng, n: [f"0x{rng.randrange(1, 256):X}" for _ in range(n)]),
+    "binaries": ("binaries", lambda rng, n: [f"0b{rng.randrange(1, 32):b}" for _ in range(n)]),
+    "dates": ("dates", lambda rng, n: [_date(rng) for _ in range(n)]),
+    "lists": ("lists", lambda rng, n: [_list(rng) for _ in range(n)]),
+}
+
+# the classic round: 5 integers, 5 reals, 4 characters, 3 booleans, 3 strings
+CLASSIC_MIX = {"integers": 5, "reals": 5, "characters": 4, "booleans": 3, "strings": 3}
+
+def classic_mix(size=20):
+    # the classic proportions at any size; integers take the rounding slack
+    mix = {t: size * n // 20 for t, n in CLASSIC_MIX.items() if t != "integers"}
+    return {"integers": size - sum(mix.values()), **mix}
+
+def extended_mix(size=20):
+    # every kind equally often; the first kinds take the remainder
+    share, extra = divmod(size, len(ITEM_KINDS))
+    return {kind: share + (i < extra) for i, kind in enumerate(ITEM_KINDS)}
+
+def generate_mix(rng, mix):
+    # one round with mix[kind] items of each kind, shuffled
+    items = []
+    for kind, (_, generate) in ITEM_KINDS.items():
+        n = mix.get(kind, 0)
+        if n:
+            items += generate(rng, n)
+    rng.shuffle(items)
+    return [str(x) for x in items]
+
+def generate_data(rng=random, size=20):
+    return generate_mix(rng, classic_mix(size))
+
+def generate_extended(rng=random, size=20):
+    return generate_mix(rng, extended_mix(size))
+
+def check_generators(rng=random, n=200):
+    # (kind, value, classified as) for every generated value of the wrong type
+    return [(kind, str(v), classify(str(v))) for kind, (type_name, generate) in ITEM_KINDS.items()
+            for v in generate(rng, n) if classify(str(v)) != type_name]
+
+def generate_grid_data(rng=random, integers=7, reals=7, characters=6):
+    # item mix for the drag-and-drop memory grids (array*.py, app.py)
+    items = rng.sample(range(1, 50), integers)
+    items += [round(rng.uniform(1, 99), 2) for _ in range(reals)]
+    items += rng.sample(string.ascii_uppercase, characters)
+    rng.shuffle(items)
+    return [str(x) for x in items]
+
+def detect_type(value: str):
+    return classify(value)
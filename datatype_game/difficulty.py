@@ -0,0 +1,68 @@
+import collections
+import threading
+
+from .classifier import TYPE_NAMES
+from .datatypes import CLASSIC_MIX, classic_mix
+
+# classic proportions by type code, the weights an error-free student gets;
+# extended types have none, so adaptive rounds stay within the classic five
+_BASE = [CLASSIC_MIX.get(name, 0) / 20 for name in TYPE_NAMES]
+
+
+class DifficultyModel:
+    # Per-student error rate for each type: an exponentially weighted moving
+    # average, moved `alpha` of the way toward 1 (wrong) or 0 (right) on each
+    # placement, so one update is a couple of float operations and a student
+    # costs one list of len(TYPE_NAMES) floats however long they play. mix()
+    # weights each type's classic share by 1 + boost * error rate, so a type a
+    # student always gets wrong shows up (1 + boost) times as often as one they
+    # always get right. Students are kept in LRU order and the least recent is
+    # dropped past `max_students`; a forgotten student starts again from the
+    # classic mix.
+
+    def __init__(self, alpha=0.2, boost=3.0, max_students=10_000):
+        self.alpha = alpha
+        self.boost = boost
+        self.max_students = max_students
+        self._rates = collections.OrderedDict()  # student key -> [error rate per type code]
+        self._lock = threading.Lock()
+
+    def record(self, student, type_code, wrong):
+        with self._lock:
+            rates = self._rates.get(student)
+            if rates is None:
+                rates = self._rates[student] = [0.0] * len(TYPE_NAMES)
+                if len(self._rates) > self.max_students:
+                    self._rates.popitem(last=False)
+            else:
+                self._rates.move_to_end(student)
+            rates[type_code] += self.alpha * (wrong - rates[type_code])
+
+    def rates(self, student):
+        # {type name: error rate}, all zero for a student with no placements
+        rates = self._rates.get(student) or [0.0] * len(TYPE_NAMES)
+        return dict(zip(TYPE_NAMES, rates))
+
+    def mix(self, student, size=20):
+        # {type name: item count} for the student's next round of `size` items
+        rates = self._rates.get(student)
+        if rates is None:
+            return classic_mix(size)
+        weights = [base * (1 + self.boost * rate) for base, rate in zip(_BASE, rates)]
+        total = sum(weights)
+        shares = [size * w / total for w in weights]
+        counts = [int(share) for share in shares]
+        # largest remainder: the leftover items go to the biggest fractions
+        by_remainder = sorted(range(len(shares)), key=lambda code: counts[code] - shares[code])
+        for code in by_remainder[:size - sum(counts)]:
+            counts[code] += 1
+        return dict(zip(TYPE_NAMES, counts))
+
+    def __len__(self):
+        return len(self._rates)
+
+
+def student_key(name, room=""):
+    # names are typed fresh each time; "Ana " and "ana" are the same student
+    return room, " ".join(name.split()).lower()
+
@@ -0,0 +1,113 @@
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from .classifier import js_rules
+from .datatypes import detect_type
+from .memory import MemoryArray
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "drop_grid_frontend")
+_drop_grid = components.declare_component("drop_grid", path=_FRONTEND_DIR)
+
+
+def drop_grid(page, items, height=700, key="drop_grid", state=None, on_change=None, ack=None):
+    # Renders drop_grid_frontend/pages/<page>.html in a bidirectional iframe.
+    # The page is static and fetched once by the browser, so each rerun only
+    # ships the item list. The page calls reportDrop(item, targetId) from its
+    # drop() handler; drops are numbered from 1 per page load, batched
+    # client-side, and the latest batch comes back here as
+    # {"token", "seq", "events": [[item_index, target, ms_since_load], ...]}
+    # where seq is the number of the last event. A batch holds every drop
+    # since `ack`, the (token, seq) the caller has applied, so when Streamlit
+    # keeps only the last of two quick batches nothing is lost; new_events()
+    # picks out the drops not applied yet.
+    # `state` goes the other way: a page that defines applyState(state) gets
+    # it after every rerun and redraws from it (see CapacityBoard.view); use
+    # on_change to apply the batch before the script computes that state.
+    return _drop_grid(page=page, items=list(items), rules=js_rules(), state=state, ack=list(ack) if ack else None,
+                      height=height, key=key, default=None, on_change=on_change)
+
+
+def new_events(batch, seq):
+    # the events of `batch` numbered past `seq`, the last drop already applied
+    events = batch["events"]
+    return events[max(0, len(events) - (batch["seq"] - seq)):]
+
+
+def record_drops(batch, items, state_key="grid_score"):
+    # Verifies a batch against detect_type and updates the session's score.
+    # The component keeps returning its last value on every rerun and a batch
+    # repeats unacknowledged drops, so each drop is applied once, by (page
+    # token, drop number). A new token is the same round remounted (after
+    # st.navigation, say), so it restarts the numbering but keeps the
+    # placements, which pages with applyState() redraw.
+    # "order" is the placed items in drop order, which is their order in memory.
+    state = st.session_state.setdefault(state_key, {"token": None, "seq": 0, "placed": [], "order": [], "wrong": 0})
+    if not batch:
+        return state
+    if batch["token"] != state["token"]:
+        state.update(token=batch["token"], seq=0)
+    if batch["seq"] <= state["seq"]:
+        return state
+    events = new_events(batch, state["seq"])
+    state["seq"] = batch["seq"]
+    order = list(state["order"])
+    for item, target, _ in events:
+        if not 0 <= item < len(items):
+            continue
+        if item in order:
+            order.remove(item)
+        # mirror the page: correct drops stay put, anything else ends up back in Available
+        if detect_type(items[item]) == target:
+            order.append(item)
+        elif target != "available":
+            state["wrong"] += 1
+    state["order"] = order
+    state["placed"] = sorted(order)
+    return state
+
+
+def placed_by_type(state, items, types=("integers", "reals", "characters")):
+    # record_drops' placements as {type: [item indexes in drop order]}, which is their order in memory
+    return {type_name: [i for i in state["order"] if detect_type(items[i]) == type_name] for type_name in types}
+
+
+def memory_arrays(containers, items, base=0x1000, capacities=None):
+    # {type: [item indexes in memory order]} -> [(type, indexes, MemoryArray)]:
+    # one array per container, laid out one after another from `base`, each
+    # starting on a 16-byte boundary. `capacities` ({type: cells}) reserves a
+    # block bigger than the items, as a container with spare slots does.
+    # ValueError for a value its cell cannot hold.
+    arrays = []
+    for type_name, ids in containers.items():
+        cells = MemoryArray(type_name, (capacities or {}).get(type_name, len(ids)), base)
+        for i, item in enumerate(ids):
+            cells[i] = items[item]
+        arrays.append((type_name, ids, cells))
+        base += -(-max(cells.nbytes, 1) // 16) * 16
+    return arrays
+
+
+def memory_layout(arrays, items):
+    # a table of where every placed item really sits
+    rows = []
+    for type_name, ids, cells in arrays:
+        for i, item in enumerate(ids):
+            rows.append({"Container": type_name, "Index": i, "Value": items[item], "Offset (bytes)": cells.offset(i),
+                         "Address": f"{cells.address(i):#06x}", "Bytes": cells.cell_bytes(i).hex(" ")})
+    return rows
+
+
+def layout_state(arrays):
+    # drop_grid `state` for pages that label each stored item with its index
+    # and address (see pages/indexed_cells.html), read from the arrays
+    return {
+        "containers": {type_name: ids for type_name, ids, _ in arrays},
+        "labels": {type_name: [f"[{i}] {cells.address(i):#06x}" for i in range(len(ids))]
+                   for type_name, ids, cells in arrays},
+    }
+
+
+def show_score(state, total):
+    st.success(f"⭐ Verified score: {len(state['placed'])} / {total} placed correctly · {state['wrong']} wrong drops")
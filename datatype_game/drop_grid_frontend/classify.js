@@ -0,0 +1,15 @@
+// Browser twin of classifier.classify(). The rule table itself comes from
+// Python (classifier.js_rules()) with the component args, so both sides
+// always use the same patterns.
+let TYPE_RULES = [];
+
+function setTypeRules(rules) {
+  TYPE_RULES = rules.map(([type, pattern]) => [type, new RegExp(pattern)]);
+}
+
+function classifyValue(val) {
+  for (const [type, re] of TYPE_RULES) {
+    if (re.test(val)) return type;
+  }
+  return "strings";
+}
@@ -0,0 +1,85 @@
+import atexit
+import collections
+import json
+import threading
+
+# Per-placement event stream of the timed sorter, one JSON object per line:
+#   {"ts", "kind": "start", "session", "round", "name", "code", "room", "items"}
+#   {"ts", "kind": "place", "session", "round", "seq", "item", "chosen",
+#    "detected", "correct", "latency_ms"}
+#   {"ts", "kind": "end", "session", "round", "score", "seconds"}
+# replay.py rebuilds any round from its "start" and "place" events.
+
+
+class EventLog:
+    # log() only appends to an in-memory buffer, so a rerun never waits on the
+    # disk. A background thread writes whatever has accumulated every
+    # `interval` seconds, or as soon as `batch` events are waiting, with one
+    # write call. Past `max_buffer` unwritten events (a stalled disk), new
+    # events are counted in `dropped` instead of growing memory without bound.
+
+    def __init__(self, path="events.jsonl", interval=1.0, batch=500, max_buffer=100_000):
+        self.path = path
+        self.interval = interval
+        self.batch = batch
+        self.max_buffer = max_buffer
+        self.written = 0
+        self.dropped = 0
+        self._buffer = collections.deque()
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def log(self, event):
+        with self._cond:
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped += 1
+                return
+            self._buffer.append(event)
+            if len(self._buffer) >= self.batch:
+                self._cond.notify()
+
+    def _take(self):
+        with self._cond:
+            events = list(self._buffer)
+            self._buffer.clear()
+        return events
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._buffer) >= self.batch, timeout=self.interval)
+            events = self._take()
+            try:
+                self._write(events)
+            except OSError:
+                self.dropped += len(events)
+
+    def _write(self, events):
+        if not events:
+            return
+        # serialized here, off the script thread
+        lines = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        with self._write_lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            self.written += len(events)
+
+    def flush(self):
+        # write everything logged so far before returning (tests, shutdown)
+        self._write(self._take())
+
+    def stats(self):
+        with self._cond:
+            pending = len(self._buffer)
+        return {"written": self.written, "pending": pending, "dropped": self.dropped}
+
+
+def read_events(path="events.jsonl"):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue  # blank, or the partial last line of a crashed process
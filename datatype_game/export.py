@@ -0,0 +1,74 @@
+import csv
+import gzip
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .results_store import COLUMNS
+
+# On-demand export of the results store. Rows are streamed from SQLite in
+# chunks straight into the output file (gzip and Parquet encode as they go),
+# so no table of the whole history is ever built. Nothing here runs during a
+# normal rerun: the download button only calls export_bytes when clicked.
+
+CHUNK_ROWS = 5000
+
+# format -> (file extension, MIME type)
+FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "csv.gz": (".csv.gz", "application/gzip"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+
+def _write_csv(rows, out):
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    writer = csv.DictWriter(text, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+    text.flush()
+    text.detach()  # leave `out` open for the caller
+
+
+def _write_parquet(rows, out):
+    schema = pa.schema([("Name", pa.string()), ("Score", pa.int64()), ("TimeTaken(s)", pa.int64()), ("Timestamp", pa.string())])
+    with pq.ParquetWriter(out, schema, compression="zstd") as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == CHUNK_ROWS:
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                chunk = []
+        if chunk:
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+
+
+def write_results(store, out, fmt="csv", name=None, since=None, until=None):
+    # streams the filtered results into the binary file object `out`
+    rows = store.iter_results(name=name, since=since, until=until, chunk_rows=CHUNK_ROWS)
+    if fmt == "csv":
+        _write_csv(rows, out)
+    elif fmt == "csv.gz":
+        with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) as gz:
+            _write_csv(rows, gz)
+    elif fmt == "parquet":
+        _write_parquet(rows, out)
+    else:
+        raise ValueError(f"unknown export format {fmt!r}")
+
+
+def export_bytes(store, fmt="csv", name=None, since=None, until=None):
+    # st.download_button wants the finished file as bytes
+    out = io.BytesIO()
+    write_results(store, out, fmt, name=name, since=since, until=until)
+    return out.getvalue()
+
+
+def export_file_name(fmt, name=None, since=None, until=None):
+    parts = ["results"]
+    if name:
+        parts.append("".join(c for c in name if c.isalnum()) or "name")
+    if since or until:
+        parts.append(f"{(since or '')[:10]}_{(until or '')[:10]}")
+    return "-".join(parts) + FORMATS[fmt][0]
@@ -0,0 +1,175 @@
+import random
+from functools import partial
+
+import streamlit as st
+
+from .containers import POLICIES, CapacityBoard, CapacityContainer, growth_costs
+from .datatypes import detect_type
+from .drop_grid import (drop_grid, layout_state, memory_arrays, memory_layout, placed_by_type, record_drops,
+                         show_score)
+from .instrument import span
+from .modes import register_mode
+from .resources import get_round_pool
+
+
+def _apply_drops(key, items):
+    # on_change of the grid: runs before the script, so the page is drawn from the updated score
+    with span(f"{key}.record_drops"):
+        record_drops(st.session_state[f"{key}_grid"], items, state_key=f"{key}_score")
+
+
+def _show_layout(arrays, items, note=None):
+    with st.expander("🧠 Memory layout (base address 0x1000)"):
+        if note:
+            st.caption(note)
+        rows = memory_layout(arrays, items)
+        if rows:
+            st.dataframe(rows, hide_index=True)
+        else:
+            st.caption("Place an item to see where it is stored.")
+
+
+def run_grid(key, title, instructions, height, pool="grid", layout=False):
+    # Shared body of the drag-and-drop memory grid modes. The page itself is
+    # drop_grid_frontend/pages/<key>.html; session keys are prefixed with the
+    # mode key so several grids can be open in one session.
+    st.title(title)
+
+    items_key = f"{key}_items"
+    if items_key not in st.session_state:
+        st.session_state[items_key] = list(get_round_pool(pool).pop().items)
+    items = st.session_state[items_key]
+
+    st.markdown(instructions)
+
+    state = record_drops(None, items, state_key=f"{key}_score")  # drops are applied by _apply_drops
+    arrays = None
+    if layout:
+        # the indexes and addresses the page shows, computed here from a real array model
+        try:
+            arrays = memory_arrays(placed_by_type(state, items), items)
+        except ValueError as e:
+            st.warning(f"Memory layout unavailable: {e}")
+    drop_grid(key, items, height=height, key=f"{key}_grid", state=arrays and layout_state(arrays),
+              on_change=partial(_apply_drops, key, items), ack=(state["token"], state["seq"]))
+    show_score(state, len(items))
+    if arrays is not None:
+        _show_layout(arrays, items)
+
+
+def memory_cells():
+    run_grid("memory_cells", "💾 Interactive Memory Cell Simulator", """
+### 🎮 Instructions
+Drag each data value into its correct memory cell:
+- 🔢 **Integer Cells** → Whole numbers (e.g., 3, 45)
+- 💧 **Real Cells** → Decimal values (e.g., 7.25)
+- 🔤 **Character Cells** → Single letters (e.g., 'K')
+""", height=700)
+
+
+def memory_grid():
+    run_grid("memory_grid", "💾 Data Type Classification Simulator — Memory Cell Grid", """
+### 🧩 Instructions
+Drag each data value into the correct container:
+- 🔢 **Integers** → Whole numbers (e.g., 7)
+- 💧 **Reals** → Decimal numbers (e.g., 3.14)
+- 🔤 **Characters** → Single letters (e.g., 'A')
+
+Each correct drop shows an **index number** below it — just like memory cell locations.
+""", height=700)
+
+
+def memory_grid_fade():
+    run_grid("memory_grid_fade", "💾 Data Type Classification — Memory Grid Simulator", """
+### 🧩 Instructions
+- Drag each data value into its **correct container**:
+  - 🔢 **Integers** → Whole numbers  
+  - 💧 **Reals** → Decimal numbers  
+  - 🔤 **Characters** → Single letters  
+- Each correct drop shows an **index number** (like a memory cell address).  
+- The index fades in dynamically — representing data being stored in memory 💫.
+""", height=750)
+
+
+def indexed_cells():
+    run_grid("indexed_cells", "💾 Interactive Memory Cell Simulator (Indexed Memory Cells)", """
+### 🧠 Instructions
+Drag each data value into its correct memory cell:
+- 🔢 **Integer Cells** → Whole numbers (e.g., 3, 45)
+- 💧 **Real Cells** → Decimal values (e.g., 7.25)
+- 🔤 **Character Cells** → Single letters (e.g., 'K')
+""", height=750, layout=True)
+
+
+# --- Capacity-limited containers (server-side engine, see containers.py) ---
+def _new_capacity_board(state):
+    # Integers always grow by doubling, which the regenerating integers
+    # exercise; Reals use the capacity and policy chosen on the page.
+    state.capacity_reals_items = list(get_round_pool("grid_no_characters").pop().items)
+    state.capacity_reals_board = CapacityBoard({
+        "integers": CapacityContainer(2, "grow"),
+        "reals": CapacityContainer(state.capacity_reals_capacity, state.capacity_reals_policy),
+    })
+
+
+def _capacity_drops():
+    # on_change of the grid: runs before the script, so the page is drawn from the updated board
+    state = st.session_state
+    items = state.capacity_reals_items
+    board = state.capacity_reals_board
+    if not board.apply(state.capacity_reals_grid, items):
+        return
+    if all(i in board.location for i, v in enumerate(items) if detect_type(v) == "integers"):
+        # every integer is stored: deal five more
+        items.extend(str(x) for x in random.sample(range(51, 100), 5))
+
+
+def capacity_reals():
+    st.title("💾 Data Type Classification — Memory Grid Simulator")
+    state = st.session_state
+    c1, c2 = st.columns(2)
+    c1.number_input("💧 Reals capacity", min_value=1, max_value=20, value=5, key="capacity_reals_capacity",
+                    on_change=_new_capacity_board, args=(state,))
+    c2.selectbox("When Reals is full", list(POLICIES), format_func=POLICIES.get, key="capacity_reals_policy",
+                 on_change=_new_capacity_board, args=(state,))
+    if "capacity_reals_board" not in state:
+        _new_capacity_board(state)
+    board = state.capacity_reals_board
+
+    st.markdown("""
+### 🧩 Instructions
+- Drag each data value into its **correct container**:
+  - 🔢 **Integers** → Whole numbers (the container doubles whenever it is full)
+  - 💧 **Reals** → Decimal numbers (limited capacity; the setting above decides what a full container does)
+- Each correct drop shows its **index number** (starting from 0), as the server stored it.
+- Integers auto-regenerate once all are placed.
+""")
+
+    view = board.view()
+    drop_grid("capacity_reals", state.capacity_reals_items, height=720, key="capacity_reals_grid",
+              state=view, on_change=_capacity_drops, ack=(board.token, board.seq))
+    st.success(f"⭐ Verified score: {board.placed()} stored · {board.wrong} wrong drops")
+    try:
+        # each container's block is its full capacity, so a grow moves the next block along
+        arrays = memory_arrays(view["containers"], state.capacity_reals_items,
+                               capacities={name: c.capacity for name, c in board.containers.items()})
+    except ValueError as e:
+        st.warning(f"Memory layout unavailable: {e}")
+    else:
+        _show_layout(arrays, state.capacity_reals_items,
+                     note="Each container owns a block of its full capacity; items are listed in index order.")
+
+    st.subheader("📈 Container costs")
+    st.dataframe([{"Container": name, **c.stats()} for name, c in board.containers.items()], hide_index=True)
+    st.caption("Copies per push is the amortized cost of growing: doubling keeps it below 1, however many items arrive.")
+    with st.expander("Why dynamic arrays double"):
+        st.markdown("Growing by one slot copies every item on every push (about n²/2 copies in total); "
+                    "doubling copies each item a bounded number of times on average (fewer than 2n in total).")
+        st.line_chart(growth_costs(256), x="Pushes", y=["Grow ×2", "Grow +1"])
+
+
+register_mode("memory_cells", "Memory Cell Simulator", "💾", memory_cells)
+register_mode("memory_grid", "Memory Cell Grid", "🧩", memory_grid)
+register_mode("memory_grid_fade", "Memory Grid Simulator", "💫", memory_grid_fade)
+register_mode("indexed_cells", "Indexed Memory Cells", "🧠", indexed_cells)
+register_mode("capacity_reals", "Capacity-Limited Reals", "📦", capacity_reals)
@@ -0,0 +1,141 @@
+import random
+
+import pandas as pd
+import streamlit as st
+
+from .datatypes import ITEM_KINDS
+from .memory import CELL_TYPES, MemoryArray
+from .modes import register_mode
+
+# Array indexing questions answered against a MemoryArray held in the
+# session: every answer is checked by asking the model, never by recomputing
+# the arithmetic here.
+
+QUESTIONS = ["address", "index", "offset", "value"]
+
+
+# --- Model and questions (no widgets) ---
+def new_array(rng=random, length=None):
+    type_name = rng.choice(list(CELL_TYPES))
+    length = length or rng.randint(6, 10)
+    values = [str(v) for v in ITEM_KINDS[type_name][1](rng, length)]
+    base = rng.randrange(0x1000, 0x10000, 0x10)
+    return MemoryArray.from_values(type_name, values, base)
+
+
+def new_question(array_, rng=random):
+    # (kind, index); the index is the element the question is about
+    return rng.choice(QUESTIONS), rng.randrange(len(array_))
+
+
+def question_text(array_, question):
+    kind, index = question
+    if kind == "address":
+        return f"What is the address of element [{index}]?"
+    if kind == "index":
+        return f"Which index does the cell at address {array_.address(index):#06x} hold?"
+    if kind == "offset":
+        return f"How many bytes after the base address does element [{index}] start?"
+    return f"What value is stored at index {index}?"
+
+
+def expected_answer(array_, question):
+    kind, index = question
+    if kind == "address":
+        return f"{array_.address(index):#06x} ({array_.address(index)})"
+    if kind == "index":
+        return str(array_.index_of(array_.address(index)))
+    if kind == "offset":
+        return str(array_.offset(index))
+    return str(array_[index])
+
+
+def check_answer(array_, question, answer):
+    kind, index = question
+    answer = answer.strip()
+    try:
+        if kind == "value":
+            expected = array_[index]
+            if array_.type_name == "reals":
+                return float(answer) == expected
+            return answer.strip("'\"") == str(expected)  # 'K' and K both count
+        number = int(answer, 0)  # addresses may be typed as 0x1f40 or 8000
+    except ValueError:
+        return False
+    if kind == "address":
+        return number == array_.address(index)
+    if kind == "index":
+        return array_.index_of(array_.address(index)) == number
+    return number == array_.offset(index)
+
+
+def layout_table(array_, reveal):
+    rows = []
+    for i in range(len(array_)):
+        row = {"Index": i, "Value": str(array_[i])}
+        if reveal:
+            row.update({"Offset (bytes)": array_.offset(i), "Address": f"{array_.address(i):#06x}",
+                        "Bytes": array_.cell_bytes(i).hex(" ")})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+# --- Page ---
+def _new_round(state):
+    state.idx_array = new_array()
+    state.idx_question = new_question(state.idx_array)
+    state.idx_feedback = None
+
+
+def submit_answer():
+    state = st.session_state
+    correct = check_answer(state.idx_array, state.idx_question, state.idx_answer)
+    state.idx_asked += 1
+    state.idx_score += correct
+    state.idx_feedback = (correct, question_text(state.idx_array, state.idx_question),
+                          expected_answer(state.idx_array, state.idx_question))
+    state.idx_question = new_question(state.idx_array)
+    state.idx_answer = ""
+
+
+def run():
+    st.title("🧮 Array Indexing — Contiguous Memory")
+    state = st.session_state
+    if "idx_array" not in state:
+        _new_round(state)
+        state.idx_score = 0
+        state.idx_asked = 0
+
+    array_ = state.idx_array
+    _, width, label = CELL_TYPES[array_.type_name]
+    st.markdown(f"""
+### 🧠 How it works
+An array of **{array_.type_name}** stores each element in a **{width}-byte** cell ({label}).
+The cells sit next to each other in memory, starting at the **base address**:
+
+`address of element [i] = base + i × {width}` · base address = **{array_.base:#06x}** ({array_.base})
+""")
+
+    reveal = st.toggle("🔍 Show offsets, addresses and raw bytes", key="idx_reveal")
+    st.dataframe(layout_table(array_, reveal), hide_index=True)
+    st.caption(f"{len(array_)} cells × {width} bytes = {array_.nbytes} bytes, "
+               f"from {array_.base:#06x} to {array_.base + array_.nbytes - 1:#06x}")
+
+    if state.idx_feedback:
+        correct, text, expected = state.idx_feedback
+        if correct:
+            st.success(f"Correct! {text} → {expected}", icon="✅")
+        else:
+            st.warning(f"Not quite. {text} → {expected}", icon="⚠️")
+
+    with st.form("idx_form"):
+        st.markdown(f"**❓ {question_text(array_, state.idx_question)}**")
+        st.text_input("Your answer", key="idx_answer", help="Addresses can be typed in hex (0x1f40) or decimal (8000).")
+        st.form_submit_button("✅ Check", on_click=submit_answer)
+
+    c1, c2 = st.columns([1, 3])
+    c1.button("🔄 New array", on_click=_new_round, args=(state,))
+    c2.success(f"⭐ Score: {state.idx_score} / {state.idx_asked}")
+
+
+register_mode("array_indexing", "Array Indexing", "🧮", run)
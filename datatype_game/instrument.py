@@ -0,0 +1,116 @@
+import contextlib
+import json
+import os
+import threading
+import time
+
+import streamlit as st
+
+# Named timing spans around the phases of a rerun, switched by env vars:
+#   DATATYPE_GAME_SPANS=jsonl,prom   which exporters to enable (off when unset)
+#   DATATYPE_GAME_SPANS_FILE         JSON lines output (default spans.jsonl)
+#   DATATYPE_GAME_PROM_FILE          Prometheus text output (default spans.prom),
+#                                    rewritten after every rerun for a textfile collector
+#   DATATYPE_GAME_PROFILE=cprofile|pyinstrument
+#                                    profile whole reruns of sessions opened with ?profile=1,
+#                                    written to DATATYPE_GAME_PROFILE_DIR (default profiles/)
+# With everything unset, span() hands back one shared no-op context manager.
+
+EXPORTERS = {e.strip() for e in os.environ.get("DATATYPE_GAME_SPANS", "").split(",") if e.strip()}
+ENABLED = bool(EXPORTERS)
+SPANS_FILE = os.environ.get("DATATYPE_GAME_SPANS_FILE", "spans.jsonl")
+PROM_FILE = os.environ.get("DATATYPE_GAME_PROM_FILE", "spans.prom")
+PROFILER = os.environ.get("DATATYPE_GAME_PROFILE", "")
+PROFILE_DIR = os.environ.get("DATATYPE_GAME_PROFILE_DIR", "profiles")
+
+_NULL = contextlib.nullcontext()
+_lock = threading.Lock()
+_totals = {}  # span name -> [count, total seconds, max seconds]
+
+
+def _record(name, seconds):
+    with _lock:
+        total = _totals.setdefault(name, [0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += seconds
+        total[2] = max(total[2], seconds)
+        if "jsonl" in EXPORTERS:
+            with open(SPANS_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"ts": time.time(), "span": name, "seconds": round(seconds, 6), "thread": threading.current_thread().name}) + "\n")
+
+
+@contextlib.contextmanager
+def _span(name):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter() - t0)
+
+
+def span(name):
+    return _span(name) if ENABLED else _NULL
+
+
+def prometheus_text():
+    with _lock:
+        totals = sorted(_totals.items())
+    lines = [
+        "# HELP datatype_game_span_seconds Time spent in named phases of a Streamlit rerun.",
+        "# TYPE datatype_game_span_seconds summary",
+    ]
+    for name, (count, total, _) in totals:
+        lines.append(f'datatype_game_span_seconds_count{{span="{name}"}} {count}')
+        lines.append(f'datatype_game_span_seconds_sum{{span="{name}"}} {total:.6f}')
+    lines.append("# HELP datatype_game_span_seconds_max Slowest observation of each span.")
+    lines.append("# TYPE datatype_game_span_seconds_max gauge")
+    for name, (_, _, slowest) in totals:
+        lines.append(f'datatype_game_span_seconds_max{{span="{name}"}} {slowest:.6f}')
+    return "\n".join(lines) + "\n"
+
+
+def _write_prometheus():
+    tmp = PROM_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, PROM_FILE)
+
+
+def _profiled(key, run):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(PROFILE_DIR, f"{key}-{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns()}")
+    if PROFILER == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            st.warning("DATATYPE_GAME_PROFILE=pyinstrument needs `pip install pyinstrument`.")
+            return run()
+        profiler = Profiler()
+        profiler.start()
+        try:
+            return run()
+        finally:
+            profiler.stop()
+            with open(path + ".html", "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(run)
+    finally:
+        profiler.dump_stats(path + ".prof")
+
+
+def run_instrumented(key, run):
+    # wraps one whole rerun of a game mode
+    if PROFILER and st.query_params.get("profile") == "1":
+        return _profiled(key, run)
+    if not ENABLED:
+        return run()
+    try:
+        with _span(f"{key}.rerun"):
+            return run()
+    finally:
+        if "prom" in EXPORTERS:
+            _write_prometheus()
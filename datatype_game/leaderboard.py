@@ -0,0 +1,89 @@
+import bisect
+import heapq
+import itertools
+import threading
+
+
+class LeaderboardIndex:
+    # Best `capacity` results kept sorted by (-Score, TimeTaken, arrival order).
+    # Adding a result is a bisect + list insert on a bounded list and reading
+    # the top n is a slice, so neither depends on how much history is stored.
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self._keys = []
+        self._rows = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        # bumped whenever the stored top-N changes
+        self.version = 0
+
+    def _key(self, record):
+        return (-int(record["Score"]), int(record["TimeTaken(s)"]), next(self._seq))
+
+    def add(self, record):
+        with self._lock:
+            key = self._key(record)
+            if len(self._keys) >= self.capacity and key >= self._keys[-1]:
+                return False
+            i = bisect.bisect(self._keys, key)
+            self._keys.insert(i, key)
+            self._rows.insert(i, record)
+            if len(self._keys) > self.capacity:
+                self._keys.pop()
+                self._rows.pop()
+            self.version += 1
+            return True
+
+    def rebuild(self, records):
+        # records must come in save order so ties keep the oldest result first
+        with self._lock:
+            self._seq = itertools.count()
+            best = heapq.nsmallest(self.capacity, ((self._key(r), r) for r in records), key=lambda kr: kr[0])
+            self._keys = [k for k, _ in best]
+            self._rows = [r for _, r in best]
+            self.version += 1
+
+    def top(self, n=10):
+        with self._lock:
+            return self._rows[:n]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class LeaderboardCache:
+    # One built leaderboard table per n, shared by every session. A save that
+    # changes the index bumps its version, which makes the next reader compare
+    # the index's top n with the cached rows; the table is rebuilt, and gets a
+    # new version, only if those rows differ. A new 11th-to-100th score leaves
+    # the top 10 table and its version as they were.
+
+    def __init__(self, index, build):
+        self.index = index
+        self.build = build
+        self.hits = 0
+        self.misses = 0
+        self._tables = {}  # n -> (index version checked, rows, (version, table))
+        self._lock = threading.Lock()
+
+    def get(self, n=10):
+        # returns (version, table); the version changes only when the top n rows do
+        version = self.index.version
+        with self._lock:
+            cached = self._tables.get(n)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached[2]
+            rows = self.index.top(n)
+            if cached is not None and cached[1] == rows:
+                self.hits += 1
+                self._tables[n] = (version, rows, cached[2])
+                return cached[2]
+            self.misses += 1
+            self._tables[n] = (version, rows, (version, self.build(rows)))
+            return self._tables[n][2]
+
+    def stats(self):
+        with self._lock:
+            return {"version": self.index.version, "hits": self.hits, "misses": self.misses}
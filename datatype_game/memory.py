@@ -0,0 +1,105 @@
+# Contiguous-memory model behind the array pages: one typed array is one
+# bytearray of fixed-width cells, read and written through a memoryview cast
+# to the cell's machine format, so element i really lives at byte offset
+# i * width and address base + i * width.
+# (memoryview.cast rather than the `array` module: array.py in the project
+# root shadows it for scripts started from there.)
+
+# type -> (memoryview/struct format, cell width in bytes, label)
+# Integers get a C int's 32 bits; a value outside INT32_RANGE is a ValueError
+# that says so, since the classifier accepts integers of any size.
+CELL_TYPES = {
+    "integers": ("i", 4, "32-bit signed integer"),
+    "reals": ("d", 8, "64-bit IEEE 754 double"),
+    "characters": ("B", 1, "1-byte ASCII character"),
+    "booleans": ("?", 1, "1-byte boolean"),
+}
+
+INT32_RANGE = (-2**31, 2**31 - 1)
+
+
+def _to_cell(type_name, value):
+    if type_name == "characters":
+        return ord(value)
+    if type_name == "booleans":
+        return value in (True, "True")
+    if type_name == "reals":
+        return float(value)
+    number = int(value)
+    if not INT32_RANGE[0] <= number <= INT32_RANGE[1]:
+        raise ValueError(f"{value} does not fit in a 32-bit integer cell "
+                         f"({INT32_RANGE[0]:,} to {INT32_RANGE[1]:,})")
+    return number
+
+
+class MemoryArray:
+    # The whole state is (type, base address, raw bytes), which is what
+    # pickling carries: a 20-cell array of doubles is 160 bytes of cells, and
+    # there is no per-element Python object (see `bench.py memory`).
+
+    __slots__ = ("type_name", "base", "_buf", "_cells")
+
+    def __init__(self, type_name, length, base=0x1000, data=None):
+        fmt, width, _ = CELL_TYPES[type_name]
+        self.type_name = type_name
+        self.base = base
+        self._buf = bytearray(data) if data is not None else bytearray(length * width)
+        self._cells = memoryview(self._buf).cast(fmt)
+
+    @classmethod
+    def from_values(cls, type_name, values, base=0x1000):
+        array_ = cls(type_name, len(values), base)
+        for i, value in enumerate(values):
+            array_[i] = value
+        return array_
+
+    @property
+    def width(self):
+        return self._cells.itemsize
+
+    @property
+    def nbytes(self):
+        return len(self._buf)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __getitem__(self, index):
+        value = self._cells[self._check(index)]
+        return chr(value) if self.type_name == "characters" else value
+
+    def __setitem__(self, index, value):
+        self._cells[self._check(index)] = _to_cell(self.type_name, value)
+
+    def _check(self, index):
+        # no negative indexes: there is no cell before the base address
+        if not 0 <= index < len(self._cells):
+            raise IndexError(f"index {index} out of range for {len(self._cells)} cells")
+        return index
+
+    def offset(self, index):
+        return self._check(index) * self.width
+
+    def address(self, index):
+        return self.base + self.offset(index)
+
+    def index_of(self, address):
+        # the index whose cell starts at `address`; ValueError inside a cell or outside the array
+        index, rest = divmod(address - self.base, self.width)
+        if rest or not 0 <= index < len(self._cells):
+            raise ValueError(f"{address:#x} is not the start of a cell")
+        return index
+
+    def cell_bytes(self, index):
+        offset = self.offset(index)
+        return bytes(self._buf[offset:offset + self.width])
+
+    def __getstate__(self):
+        return self.type_name, self.base, bytes(self._buf)
+
+    def __setstate__(self, state):
+        type_name, base, data = state
+        MemoryArray.__init__(self, type_name, 0, base, data)
+
+    def __repr__(self):
+        return f"MemoryArray({self.type_name!r}, {len(self)} cells at {self.base:#x})"
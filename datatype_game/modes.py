@@ -0,0 +1,36 @@
+import collections
+
+import streamlit as st
+
+from .instrument import run_instrumented
+
+GameMode = collections.namedtuple("GameMode", ["key", "title", "icon", "run"])
+
+# key -> GameMode, in registration order (the order shown in the navigation)
+MODES = {}
+
+
+def register_mode(key, title, icon, run):
+    if key in MODES:
+        raise ValueError(f"game mode {key!r} is already registered")
+    MODES[key] = GameMode(key, title, icon, run)
+    return MODES[key]
+
+
+def run_mode(key):
+    # entry point for the single-mode scripts (app.py, array*.py, app2.py)
+    mode = MODES[key]
+    st.set_page_config(page_title=mode.title, page_icon=mode.icon, layout="wide")
+    run_instrumented(mode.key, mode.run)
+
+
+def _page(mode):
+    def page():
+        run_instrumented(mode.key, mode.run)
+    page.__name__ = mode.key
+    return st.Page(page, title=mode.title, icon=mode.icon, url_path=mode.key)
+
+
+def navigation():
+    # every registered mode as a page of one Streamlit app
+    return st.navigation([_page(mode) for mode in MODES.values()])
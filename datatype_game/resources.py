@@ -0,0 +1,170 @@
+import heapq
+import os
+import re
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from .archive import ResultsArchive
+from .datatypes import generate_data, generate_extended, generate_grid_data
+from .difficulty import DifficultyModel
+from .event_log import EventLog
+from .leaderboard import LeaderboardCache, LeaderboardIndex
+from .results_store import COLUMNS, ResultsStore
+from .round_pool import RoundPool
+from .round_registry import RoundRegistry
+from .write_queue import ResultsWriteQueue
+
+# Process-wide objects shared by every mode and every session.
+
+# --- Configuration ---
+RESULTS_FILE = "results.csv"  # legacy file, imported once into RESULTS_DB
+RESULTS_DB = "results.db"
+RESULTS_ARCHIVE = "results_archive"  # columnar copy of RESULTS_DB for analytics
+EVENTS_FILE = "events.jsonl"  # per-placement event stream, see event_log.py
+RESULTS_JOURNAL = "results.journal"  # saved results not yet known to be in their store, see write_queue.py
+RESULTS_FSYNC_INTERVAL = 0.1  # seconds; saves arriving within one interval share a single fsync
+ROOMS_DIR = "rooms"  # one database and archive per classroom, see room_paths()
+DEFAULT_ROOM = ""  # no room code: the original RESULTS_DB and RESULTS_ARCHIVE
+
+ROUND_GENERATORS = {
+    "sorter": generate_data,
+    "sorter_extended": generate_extended,  # every item kind, see datatypes.ITEM_KINDS
+    "grid": generate_grid_data,
+    "grid_no_characters": partial(generate_grid_data, integers=10, reals=10, characters=0),
+}
+
+
+# --- Rooms ---
+# Each classroom's results live in their own SQLite file with their own
+# leaderboard index and cache, so saves in one room never wait on another
+# room's write lock and a save only bumps its own room's leaderboard version.
+# A room's database is created by its first saved result, never by viewing it.
+ROOM_CODE = re.compile(r"[a-z0-9-]{3,32}")
+
+
+def normalize_room(code):
+    # room codes are typed by students: case-insensitive, letters, digits and dashes
+    return re.sub(r"[^a-z0-9-]", "", (code or "").strip().lower())[:32]
+
+
+def valid_room(room):
+    # a normalized code that results may be saved under: none, or 3 to 32 characters
+    return room == DEFAULT_ROOM or ROOM_CODE.fullmatch(room) is not None
+
+
+def room_exists(room):
+    return room == DEFAULT_ROOM or os.path.exists(room_paths(room)[0])
+
+
+def room_paths(room):
+    # (database, archive directory) for a normalized room code
+    if room == DEFAULT_ROOM:
+        return RESULTS_DB, RESULTS_ARCHIVE
+    return os.path.join(ROOMS_DIR, f"{room}.db"), os.path.join(ROOMS_DIR, f"{room}_archive")
+
+
+def list_rooms():
+    # the default room plus every room that has saved a result
+    rooms = [DEFAULT_ROOM]
+    if os.path.isdir(ROOMS_DIR):
+        rooms += sorted(name[:-3] for name in os.listdir(ROOMS_DIR) if name.endswith(".db"))
+    return rooms
+
+
+@st.cache_resource
+def get_store(room=DEFAULT_ROOM):
+    # creates the room's database; readers check room_exists() first
+    if room == DEFAULT_ROOM:
+        return ResultsStore(RESULTS_DB, legacy_csv=RESULTS_FILE)
+    os.makedirs(ROOMS_DIR, exist_ok=True)
+    return ResultsStore(room_paths(room)[0])
+
+
+@st.cache_resource
+def get_archive(room=DEFAULT_ROOM):
+    return ResultsArchive(get_store(room), room_paths(room)[1])
+
+
+@st.cache_resource
+def get_event_log():
+    return EventLog(EVENTS_FILE)
+
+
+@st.cache_resource
+def get_results_queue():
+    # process-wide; creating it replays the journal into the stores
+    return ResultsWriteQueue(
+        RESULTS_JOURNAL,
+        get_store,
+        on_commit=lambda room, rows: get_archive(room).maybe_compact(rows),
+        fsync_interval=RESULTS_FSYNC_INTERVAL,
+    )
+
+
+@st.cache_resource
+def get_leaderboard(room=DEFAULT_ROOM):
+    # built once per process from the room's stored results, then kept current
+    # by save_result; the journal is replayed first so no acknowledged result is missing
+    get_results_queue()
+    index = LeaderboardIndex()
+    if room_exists(room):
+        index.rebuild(get_store(room).iter_results())
+    return index
+
+
+@st.cache_resource
+def get_leaderboard_cache(room=DEFAULT_ROOM):
+    return LeaderboardCache(get_leaderboard(room), lambda rows: pd.DataFrame(rows, columns=COLUMNS))
+
+
+@st.cache_resource
+def get_round_pool(kind, size=None):
+    # ready-made rounds, refilled in the background; `size` is the item count
+    # for generators that take one (the timed sorter's practice/stress rounds)
+    if size is None:
+        return RoundPool(ROUND_GENERATORS[kind])
+    return RoundPool(partial(ROUND_GENERATORS[kind], size=size), size=32 if size <= 100 else 4)
+
+
+@st.cache_resource
+def get_difficulty_model():
+    # per-student error rates for adaptive rounds; in memory, so a restart forgets them
+    return DifficultyModel()
+
+
+@st.cache_resource
+def get_round_registry():
+    # rounds in play across all sessions; scores are verified against it at save time
+    return RoundRegistry()
+
+
+def save_result(name, score, duration_played, room=DEFAULT_ROOM):
+    # Queues the result and returns its seq without touching the disk; the
+    # leaderboard shows it at once, and result_saved(seq) turns true once it
+    # is in the fsynced journal. The index is built before queueing so its
+    # rebuild can never read this row back a second time.
+    leaderboard = get_leaderboard(room)
+    seq, record = get_results_queue().save(name, score, duration_played, room)
+    leaderboard.add(record)
+    return seq
+
+
+def result_saved(seq):
+    return get_results_queue().durable(seq)
+
+
+def load_leaderboard(n=10, room=DEFAULT_ROOM):
+    # returns (version, table); the table is shared, so callers must not modify it
+    return get_leaderboard_cache(room).get(n)
+
+
+def load_all_rooms_leaderboard(n=10):
+    # cross-room top n, merged on demand from each room's own top n; rooms
+    # that no process has opened yet are loaded (and cached) on the way
+    rows = []
+    for room in list_rooms():
+        rows += [dict(record, Room=room or "-") for record in get_leaderboard(room).top(n)]
+    best = heapq.nsmallest(n, rows, key=lambda r: (-int(r["Score"]), int(r["TimeTaken(s)"]), r["Timestamp"]))
+    return pd.DataFrame(best, columns=["Room"] + COLUMNS)
@@ -0,0 +1,146 @@
+import csv
+import os
+import sqlite3
+import threading
+
+COLUMNS = ["Name", "Score", "TimeTaken(s)", "Timestamp"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    time_taken INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_timestamp ON results (timestamp);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ResultsStore:
+    # Append-only results table in SQLite (WAL mode). Saves arrive from the
+    # write queue as append_many() batches, one INSERT per row in a single
+    # transaction, so their cost does not depend on how many results are
+    # stored, and SQLite's own locking keeps concurrent processes from losing rows.
+
+    def __init__(self, path="results.db", legacy_csv=None):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        if legacy_csv:
+            self.migrate_csv(legacy_csv)
+
+    def _conn(self):
+        # one connection per thread: Streamlit runs every session in its own thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append_many(self, rows, journal_seq=None):
+        # rows of (name, score, time_taken, timestamp), written in one
+        # transaction; journal_seq records, in that same transaction, the last
+        # write-queue journal entry the rows include (see write_queue.py)
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany("INSERT INTO results (name, score, time_taken, timestamp) VALUES (?, ?, ?, ?)", rows)
+            if journal_seq is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('journal_seq', ?)", (str(journal_seq),)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def migrate_csv(self, csv_path):
+        # One-time import of the old results.csv. The marker row and the data
+        # are written in the same transaction, so a second process starting at
+        # the same time either sees the marker or waits on the write lock.
+        if not os.path.exists(csv_path):
+            return 0
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'csv_migrated'").fetchone()
+            if done:
+                conn.execute("ROLLBACK")
+                return 0
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = [
+                    (r["Name"], int(float(r["Score"])), int(float(r["TimeTaken(s)"])), r["Timestamp"])
+                    for r in csv.DictReader(f)
+                ]
+            conn.executemany(
+                "INSERT INTO results (name, score, time_taken, timestamp) VALUES (?, ?, ?, ?)", rows
+            )
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('csv_migrated', ?)", (os.path.abspath(csv_path),)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def journal_seq(self):
+        # last write-queue journal entry committed here, 0 if none
+        row = self._conn().execute("SELECT value FROM meta WHERE key = 'journal_seq'").fetchone()
+        return int(row[0]) if row else 0
+
+    def checkpoint(self):
+        # with synchronous=NORMAL a commit is only guaranteed on disk once
+        # the WAL has been checkpointed with a sync
+        self._conn().execute("PRAGMA wal_checkpoint(FULL)")
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def max_id(self):
+        return self._conn().execute("SELECT COALESCE(MAX(id), 0) FROM results").fetchone()[0]
+
+    def rows_after(self, last_id, limit=-1):
+        # raw (id, name, score, time_taken, timestamp) rows past last_id, for the archive
+        return self._conn().execute(
+            "SELECT id, name, score, time_taken, timestamp FROM results WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, limit),
+        ).fetchall()
+
+    def iter_results(self, name=None, since=None, until=None, chunk_rows=5000):
+        # Filtered rows, oldest first, fetched chunk_rows at a time so
+        # an export never holds the whole history in memory. name matches
+        # case-insensitively anywhere in the player name; since/until are
+        # timestamp strings (inclusive lower bound, exclusive upper bound),
+        # which compare correctly because they are ISO formatted.
+        where, params = [], []
+        if name:
+            where.append("name LIKE ?")
+            params.append(f"%{name}%")
+        if since:
+            where.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            where.append("timestamp < ?")
+            params.append(until)
+        sql = "SELECT name, score, time_taken, timestamp FROM results"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        # with a date filter, walk the timestamp index (it carries the id, so
+        # no sort); otherwise insertion order is the rowid scan
+        order = " ORDER BY timestamp, id" if since or until else " ORDER BY id"
+        cur = self._conn().execute(sql + order, params)
+        while True:
+            rows = cur.fetchmany(chunk_rows)
+            if not rows:
+                break
+            for name_, score, time_taken, timestamp in rows:
+                yield {"Name": name_, "Score": score, "TimeTaken(s)": time_taken, "Timestamp": timestamp}
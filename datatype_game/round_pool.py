@@ -0,0 +1,88 @@
+import collections
+import random
+import threading
+from functools import lru_cache
+
+from .classifier import TYPE_CODES, TYPE_NAMES, classify_many
+
+# items: tuple of strings; types: bytes, one classifier.TYPE_CODES code per item;
+# masks: one int bitmask of item ids per type code, so with the placed-items
+# mask a container count is one AND and a popcount.
+# Rounds are immutable and shared by every session that plays them; an item
+# is identified by its index, so repeated values ("True", "CS") stay distinct.
+Round = collections.namedtuple("Round", ["items", "types", "masks"])
+
+
+def round_from_items(items):
+    # classify and build the masks once here, not on every placement
+    items = tuple(items)
+    types = bytes(TYPE_CODES[t] for t in classify_many(items))
+    return Round(items, types, type_masks(types))
+
+
+def type_masks(types):
+    masks = []
+    for code in range(len(TYPE_NAMES)):
+        bits = bytes(48 + (t == code) for t in reversed(types))  # b"0"/b"1", highest id first
+        masks.append(int(bits or b"0", 2))
+    return tuple(masks)
+
+
+def iter_bits(mask, limit=None):
+    # ids of the set bits, lowest first; each step is a few C-level int ops
+    while mask and limit != 0:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+        if limit is not None:
+            limit -= 1
+
+
+def make_round(generate, rng):
+    # items are already shuffled by the generator
+    return round_from_items(generate(rng))
+
+
+class RoundPool:
+    # Keeps up to `size` ready rounds and tops them up on a background thread,
+    # so starting a game is a deque pop instead of generating inline.
+    # pop(seed=...) instead returns the round derived from that seed, which is
+    # the same for every caller: give a whole class one code for identical rounds.
+
+    def __init__(self, generate, size=32):
+        self.generate = generate
+        self.size = size
+        self._rounds = collections.deque()
+        self._cond = threading.Condition()
+        self._rng = random.Random()
+        self.seeded = lru_cache(maxsize=128)(self._seeded)
+        self._thread = threading.Thread(target=self._refill, name="round-pool", daemon=True)
+        self._thread.start()
+
+    def _refill(self):
+        while True:
+            with self._cond:
+                while len(self._rounds) >= self.size:
+                    self._cond.wait()
+            # generate outside the lock so pop() never waits on it
+            round_ = make_round(self.generate, self._rng)
+            with self._cond:
+                self._rounds.append(round_)
+
+    def _seeded(self, seed):
+        return make_round(self.generate, random.Random(seed))
+
+    def pop(self, seed=None):
+        if seed:
+            return self.seeded(seed)
+        with self._cond:
+            round_ = self._rounds.popleft() if self._rounds else None
+            self._cond.notify()
+        if round_ is None:
+            # pool drained by a burst of starts: fall back to generating inline
+            round_ = make_round(self.generate, random)
+        return round_
+
+    def __len__(self):
+        with self._cond:
+            return len(self._rounds)
@@ -0,0 +1,71 @@
+import collections
+import heapq
+import threading
+import time
+import uuid
+
+from .classifier import TYPE_CODES
+
+# Server-side record of every round handed out. The session only ever holds
+# the round id: the items, the start time and each placement live here, so
+# the score that gets saved is recomputed from what the server saw rather
+# than taken from session state.
+
+IssuedRound = collections.namedtuple("IssuedRound", ["round", "started", "duration", "placements"])
+
+
+class RoundRegistry:
+    # issue() stores the round with a time.monotonic() start; record() appends
+    # one (monotonic time, item id, chosen type code) tuple per placement; and
+    # verify() replays those tuples once, O(placements), to get the score and
+    # the time played, then forgets the round. Rounds that are never verified
+    # (closed tabs) are dropped `grace` seconds after they expire. Rounds last
+    # from 60 s to hours, so issue order is not expiry order: a heap of
+    # (drop time, round id) lets each sweep pop exactly the rounds that are
+    # due. A verified round leaves its heap entry behind, which is popped, as
+    # a no-op, when it comes due.
+
+    def __init__(self, grace=300):
+        self.grace = grace
+        self._rounds = {}
+        self._expiry = []  # heap of (monotonic drop time, round id)
+        self._lock = threading.Lock()
+
+    def issue(self, round_, duration):
+        now = time.monotonic()
+        round_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                self._rounds.pop(heapq.heappop(self._expiry)[1], None)
+            self._rounds[round_id] = IssuedRound(round_, now, duration, [])
+            heapq.heappush(self._expiry, (now + duration + self.grace, round_id))
+        return round_id
+
+    def record(self, round_id, item_id, chosen):
+        # False if the server will not count this placement
+        now = time.monotonic()
+        issued = self._rounds.get(round_id)
+        if issued is None or not 0 <= item_id < len(issued.round.items) or now - issued.started > issued.duration:
+            return False
+        issued.placements.append((now, item_id, TYPE_CODES.get(chosen, 255)))
+        return True
+
+    def verify(self, round_id):
+        # (score, seconds played) from the recorded placements, or None for an unknown round
+        with self._lock:
+            issued = self._rounds.pop(round_id, None)
+        if issued is None:
+            return None
+        types, deadline = issued.round.types, issued.started + issued.duration
+        placed = bytearray(len(types))  # constant-time per placement, unlike a big-int mask
+        score = 0
+        for at, item_id, code in issued.placements:
+            if at > deadline:
+                break
+            if not placed[item_id] and types[item_id] == code:
+                placed[item_id] = 1
+                score += 1
+        return score, int(min(time.monotonic() - issued.started, issued.duration))
+
+    def __len__(self):
+        return len(self._rounds)
@@ -0,0 +1,482 @@
+import datetime
+import math
+import random
+import time
+import uuid
+from functools import partial
+
+import streamlit as st
+
+from .classifier import TYPE_CODES, TYPE_NAMES
+from .datatypes import generate_mix
+from .difficulty import student_key
+from .export import FORMATS, export_bytes, export_file_name
+from .instrument import span
+from .modes import register_mode
+from .round_pool import iter_bits, round_from_items
+from .resources import (DEFAULT_ROOM, get_difficulty_model, get_event_log, get_leaderboard_cache, get_round_pool,
+                        get_round_registry, get_store, load_all_rooms_leaderboard, load_leaderboard, normalize_room,
+                        room_exists, valid_room,
+                        result_saved, save_result)
+
+# --- Configuration ---
+GAME_DURATION = 60  # seconds
+CONTAINERS = ["integers","reals","characters","booleans","strings"]
+# the classic five first, then the extended catalogue (classifier.RULES)
+EXTENDED_CONTAINERS = CONTAINERS + [t for t in TYPE_NAMES if t not in CONTAINERS]
+CONTAINER_TITLES = {"integers": "🔢 Integers", "reals": "💧 Reals", "characters": "🔤 Characters", "booleans": "⚙️ Booleans",
+                    "strings": "🧾 Strings", "nulls": "∅ Nulls", "hexadecimals": "🔣 Hexadecimals", "binaries": "0️⃣ Binaries",
+                    "dates": "📅 Dates", "lists": "📋 Lists"}
+_CLASSIC_CODES = bytes(TYPE_CODES[c] for c in CONTAINERS)
+# round size -> label; only classic rounds go on the leaderboard
+ROUND_SIZES = {20: "20 items (classic)", 100: "100 items (practice)", 500: "500 items (practice)", 2000: "2,000 items (stress)", 10000: "10,000 items (stress)"}
+CLASSIC_SIZE = 20
+PAGE_SIZE = 20  # Available items rendered as widgets per rerun, whatever the round size
+CONTAINER_PREVIEW = 30  # items listed per container; the rest are counted
+
+def round_containers(round_):
+    # containers offered for a round: the classic five unless it has an extended-type item
+    return EXTENDED_CONTAINERS if round_.types.translate(None, _CLASSIC_CODES) else CONTAINERS
+
+def round_mode(size, extended=False, adaptive=False):
+    # what a round counts as; only "classic" rounds (classic size, fixed
+    # classic mix) are comparable, so only they go on the leaderboard
+    if extended:
+        return "extended"  # drawn from the extended pool, adaptive or not
+    if adaptive:
+        return "adaptive"
+    return "classic" if size == CLASSIC_SIZE else "practice"
+
+# mode -> notice for a round that is not saved
+UNSAVED_MODES = {
+    "practice": "📝 Practice round: not saved to the leaderboard.",
+    "extended": "🧪 Extended-types round: practice only, not saved to the leaderboard.",
+    "adaptive": "🎯 Adaptive round: its mix is personal, so it is not saved to the leaderboard.",
+}
+
+def round_duration(size):
+    # classic rounds keep the one-minute timer; bigger rounds get 3 s per item
+    return GAME_DURATION if size <= CLASSIC_SIZE else 3 * size
+
+# --- Game logic (no widgets, so loadtest.py can drive it headlessly) ---
+# A round in play is the shared, immutable Round from the pool (item strings
+# plus a bytes object of type codes) and one int bitmask of the item ids
+# placed so far. Placing is a bit test and a bit set; nothing is copied or
+# searched, and repeated values are told apart by id.
+# Pass an EventLog as `events` to record the round for replay.py, and a
+# RoundRegistry as `registry` to have the server keep its own copy of the
+# round and every placement (verify_round() then gives the score to save);
+# replay.py calls these with neither.
+def start_round(state, round_, events=None, name="", code="", registry=None, room=DEFAULT_ROOM, mode="classic"):
+    # reset game state
+    state["round"] = round_
+    state["placed"] = 0
+    state["score"] = 0
+    state["start_time"] = time.time()
+    state["started"] = time.monotonic()  # the clock expiry is judged by; wall time can jump
+    state["ended"] = None
+    state["game_over"] = False
+    state["duration"] = round_duration(len(round_.items))
+    state["room"] = room  # where the result is saved, fixed for the whole round
+    state["mode"] = mode  # see round_mode()
+    state["round_id"] = registry.issue(round_, state["duration"]) if registry is not None else uuid.uuid4().hex[:12]
+    state["seq"] = 0
+    state["last_action"] = time.monotonic()
+    if events is not None:
+        events.log({"ts": state["start_time"], "kind": "start", "session": state.get("session_id"),
+                    "round": state["round_id"], "name": name, "code": code, "room": room, "mode": mode,
+                    "items": list(round_.items)})
+
+def elapsed(state):
+    # seconds on the round clock, frozen once the round ends
+    if state.get("started") is None:
+        return 0.0
+    return (state.get("ended") or time.monotonic()) - state["started"]
+
+def time_left(state):
+    return max(state.get("duration", GAME_DURATION) - elapsed(state), 0.0)
+
+def end_game(state):
+    if not state.get("game_over"):
+        state["game_over"] = True
+        state["ended"] = time.monotonic()
+
+def check_expiry(state):
+    # True once the round is over; ends it when its time has run out
+    if not state.get("game_over") and state.get("started") is not None and time_left(state) <= 0:
+        end_game(state)
+    return state.get("game_over", False)
+
+def available_ids(state):
+    n = len(state["round"].items)
+    return list(iter_bits(~state["placed"] & ((1 << n) - 1)))
+
+def available_count(state):
+    return len(state["round"].items) - state["placed"].bit_count()
+
+def available_page(state, page, per_page=PAGE_SIZE):
+    # ids of the available items ranked page*per_page onwards, without walking
+    # the whole round: binary-search the first id with that many free ids
+    # below it (a popcount per step), then take free bits one at a time
+    placed, n, rank = state["placed"], len(state["round"].items), page * per_page
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if mid - (placed & ((1 << mid) - 1)).bit_count() < rank:
+            lo = mid + 1
+        else:
+            hi = mid
+    free = ~(placed >> lo) & ((1 << (n - lo)) - 1)
+    return [lo + i for i in iter_bits(free, per_page)]
+
+def container_items(state, container, limit=None):
+    mask = state["placed"] & state["round"].masks[TYPE_CODES[container]]
+    return [state["round"].items[i] for i in iter_bits(mask, limit)]
+
+def container_count(state, container):
+    return (state["placed"] & state["round"].masks[TYPE_CODES[container]]).bit_count()
+
+def log_placement(state, events, item_id, chosen, detected):
+    now = time.monotonic()
+    state["seq"] = state.get("seq", 0) + 1
+    events.log({"ts": time.time(), "kind": "place", "session": state.get("session_id"), "round": state.get("round_id"),
+                "seq": state["seq"], "item_id": item_id, "item": state["round"].items[item_id], "chosen": chosen,
+                "detected": detected, "correct": chosen == detected,
+                "latency_ms": round((now - state.get("last_action", now)) * 1e3, 1)})
+    state["last_action"] = now
+
+def place_item(state, item_id, chosen, events=None, registry=None, difficulty=None):
+    # True if correct (+1, the item leaves Available); a wrong item stays available.
+    # A stale click on an item that is already placed, or any click after the
+    # round has expired (however late the request arrives), changes nothing.
+    # With a DifficultyModel, the placement also updates the error rate of
+    # state["student"] (set on Start) for the item's type.
+    bit = 1 << item_id
+    if state["placed"] & bit or check_expiry(state):
+        return False
+    if registry is not None:
+        registry.record(state["round_id"], item_id, chosen)
+    code = state["round"].types[item_id]
+    detected = TYPE_NAMES[code]
+    if difficulty is not None and state.get("student") is not None:
+        difficulty.record(state["student"], code, chosen != detected)
+    if events is not None:
+        log_placement(state, events, item_id, chosen, detected)
+    if chosen == detected:
+        state["score"] += 1
+        state["placed"] |= bit
+        return True
+    return False
+
+def verify_round(state, registry):
+    # (score, seconds) as the server saw the round, or None for a round the
+    # registry does not know (issued before a restart, or long expired), which
+    # must not be saved
+    return registry.verify(state.get("round_id"))
+
+def end_round(state, events, seconds):
+    events.log({"ts": time.time(), "kind": "end", "session": state.get("session_id"), "round": state.get("round_id"),
+                "score": state["score"], "seconds": seconds})
+
+# --- Utilities ---
+def submit_batch():
+    # Form callback for batch mode: runs before the rerun, so a whole round of
+    # placements costs one script execution instead of one per item.
+    events, registry, difficulty = get_event_log(), get_round_registry(), get_difficulty_model()
+    items = st.session_state.round.items
+    feedback = []
+    # only the page that was on screen had selectboxes
+    for item_id in available_page(st.session_state, st.session_state.get("available_page", 0)):
+        target = st.session_state.pop(f"batch_{item_id}", None)
+        if target is None:
+            continue
+        if place_item(st.session_state, item_id, target, events, registry, difficulty):
+            feedback.append(("success", f"Correct! +1 point ({items[item_id]} → {target})"))
+        else:
+            feedback.append(("warning", f"Wrong container for {items[item_id]}. It has been returned to Available."))
+    st.session_state.batch_feedback = feedback
+
+def show_container(state, title, container):
+    count = container_count(state, container)
+    st.markdown(f"#### {title} ({count})")
+    shown = container_items(state, container, CONTAINER_PREVIEW)
+    st.write(shown or "_(empty)_")
+    if count > len(shown):
+        st.caption(f"… and {count - len(shown):,} more")
+
+def page_controls(state):
+    # Prev/Next over the Available list; the page is clamped as items get placed
+    pages = max(1, -(-available_count(state) // PAGE_SIZE))
+    page = min(st.session_state.get("available_page", 0), pages - 1)
+    st.session_state.available_page = page
+    if pages > 1:
+        p1, p2, p3 = st.columns([1,2,1])
+        if p1.button("◀", key="page_prev", disabled=page == 0):
+            st.session_state.available_page = page - 1
+            st.rerun()
+        p2.caption(f"Page {page + 1} of {pages} · {available_count(state):,} left")
+        if p3.button("▶", key="page_next", disabled=page >= pages - 1):
+            st.session_state.available_page = page + 1
+            st.rerun()
+    return page
+
+def status_bar():
+    # Timer and score. While a round is on, this runs as a fragment every
+    # second, so the countdown moves without rerunning the rest of the page.
+    state = st.session_state
+    if state.start_time and check_expiry(state):
+        st.rerun()  # whole page: game over, save the result
+    status_col1, status_col2 = st.columns([1,1])
+    with status_col1:
+        st.info(f"⏱️ Time left: {math.ceil(time_left(state))} sec")
+    with status_col2:
+        st.success(f"⭐ Score: {state.score}")
+
+def save_status():
+    # The save is written in the background; poll until it is acknowledged,
+    # then rerun the page once so the polling stops.
+    seq = st.session_state.get("save_seq")
+    if seq is None:
+        st.info(st.session_state.get("save_skipped") or "📝 Practice round: not saved to the leaderboard.")
+    elif result_saved(seq):
+        st.info("📁 Your result has been saved.")
+        if st.session_state.get("save_pending"):
+            st.session_state.save_pending = False
+            st.rerun()
+    else:
+        st.session_state.save_pending = True
+        st.caption("⏳ Saving your result…")
+
+def run():
+    st.title("🧠 Data Type Classification Simulator — Stable Scoring + Leaderboard")
+
+    # --- Session state init ---
+    with span("sorter.session_init"):
+        if "session_id" not in st.session_state:
+            st.session_state.session_id = uuid.uuid4().hex[:12]
+        if "student_name" not in st.session_state:
+            st.session_state.student_name = ""
+        if "round" not in st.session_state:
+            st.session_state.round = get_round_pool("sorter").pop()
+        if "placed" not in st.session_state:
+            st.session_state.placed = 0
+        if "score" not in st.session_state:
+            st.session_state.score = 0
+        if "start_time" not in st.session_state:
+            st.session_state.start_time = None
+        if "game_over" not in st.session_state:
+            st.session_state.game_over = False
+
+    # --- Top bar: Name input & start/reset controls ---
+    col1, col2, col3 = st.columns([3,2,1])
+
+    with col1:
+        name = st.text_input("👤 Enter your name:", value=st.session_state.student_name)
+        if name and not st.session_state.start_time:
+            # set the name but don't auto-start until user presses Start
+            st.session_state.student_name = name
+        st.text_input("🏫 Room code (optional):", key="room_code", max_chars=32, help="Your class's own leaderboard. Results are saved to the room you start in.")
+        if not valid_room(normalize_room(st.session_state.room_code)):
+            st.warning("Room codes are 3 to 32 letters, digits or dashes.")
+        st.text_input("🎲 Class round code (optional):", key="round_code", help="Everyone who starts with the same code gets the same items.")
+        st.selectbox("📏 Round size", options=list(ROUND_SIZES), format_func=ROUND_SIZES.get, key="round_size", help="Practice and stress rounds are longer and are not saved to the leaderboard.")
+        adaptive = st.toggle("🎯 Adaptive mix", key="adaptive_mix", help="More items of the types you get wrong. Ignored with a class round code. Not saved to the leaderboard.")
+        if adaptive and name:
+            rates = get_difficulty_model().rates(student_key(name, normalize_room(st.session_state.room_code)))
+            st.caption("Your error rates: " + ", ".join(f"{t} {rates[t]:.0%}" for t in CONTAINERS))
+        extended = st.toggle("🧪 Extended types", key="extended_types", help="Adds None/null, hex and binary literals, dates and lists, plus negative and scientific numbers. Practice only.")
+
+    with col2:
+        if st.button("▶️ Start / Restart"):
+            code = st.session_state.round_code.strip()
+            size = st.session_state.round_size
+            kind = "sorter_extended" if extended else "sorter"
+            pool = get_round_pool(kind) if size == CLASSIC_SIZE else get_round_pool(kind, size)
+            room = normalize_room(st.session_state.room_code)
+            if not valid_room(room):
+                st.warning("Fix the room code (3 to 32 letters, digits or dashes) before starting.")
+                st.stop()
+            st.session_state.student = student_key(name, room)
+            mode = round_mode(size, extended, adaptive and not code)
+            if mode == "adaptive":
+                # built per student, so it cannot come from the shared pool
+                with span("sorter.adaptive_round"):
+                    mix = get_difficulty_model().mix(st.session_state.student, size)
+                    round_ = round_from_items(generate_mix(random, mix))
+            else:
+                round_ = pool.pop(seed=code)
+            start_round(st.session_state, round_, get_event_log(), name, code, get_round_registry(), room, mode)
+            st.session_state.available_page = 0
+            if name:
+                st.session_state.student_name = name
+            else:
+                st.warning("Please enter your name before starting.")
+                st.stop()
+
+    with col3:
+        if st.button("⏹️ End Now"):
+            if not st.session_state.start_time:
+                st.info("Game hasn't started yet.")
+            else:
+                end_game(st.session_state)
+
+    st.toggle("📝 Batch mode: assign every item, then submit once", key="batch_mode")
+
+    # ensure name present to play
+    if not st.session_state.student_name:
+        st.info("Enter your name and press Start to begin.")
+        st.stop()
+
+    # --- Timer logic ---
+    if st.session_state.start_time:
+        check_expiry(st.session_state)
+
+    # --- Game over handling ---
+    if st.session_state.game_over:
+        verified = None
+        if st.session_state.start_time is not None:
+            # the score and time to save are the server's, recomputed from its own record of the round
+            verified = verify_round(st.session_state, get_round_registry())
+            if verified is not None:
+                st.session_state.score, total_time = verified
+            else:
+                total_time = int(elapsed(st.session_state))
+        st.warning("⏰ Time’s up!" if time_left(st.session_state) == 0 else "🛑 Game ended.")
+        st.success(f"🏆 Final Score for {st.session_state.student_name}: {st.session_state.score}")
+        # Save results (only once per end)
+        if st.session_state.start_time is not None:
+            # Save and then clear start_time so we don't keep saving on reruns
+            st.session_state.save_skipped = None
+            if verified is None:
+                st.session_state.save_seq = None
+                st.session_state.save_skipped = ("⚠️ The server has no record of this round (it was restarted, "
+                                                 "or the round expired long ago), so the result was not saved.")
+            elif st.session_state.get("mode") == "classic":
+                st.session_state.save_seq = save_result(
+                    st.session_state.student_name, st.session_state.score, total_time, st.session_state.room)
+            else:
+                st.session_state.save_seq = None
+                st.session_state.save_skipped = UNSAVED_MODES[st.session_state.mode]
+            end_round(st.session_state, get_event_log(), total_time)
+            st.session_state.start_time = None
+        st.fragment(save_status, run_every=None if result_saved(st.session_state.get("save_seq") or 0) else 0.5)()
+        # Show leaderboard below, but allow restart
+        st.markdown("---")
+
+    # --- Top status display ---
+    running = bool(st.session_state.start_time) and not st.session_state.game_over
+    st.fragment(status_bar, run_every=1 if running else None)()
+
+    # --- Main game UI (only if not game over) ---
+    if not st.session_state.game_over:
+        st.markdown("### 🎯 Place each item into the correct container")
+        if st.session_state.batch_mode:
+            st.markdown("Choose a container for each item and click **Submit all placements**. Correct placements give +1 point; incorrect placements return the item to Available.")
+        else:
+            st.markdown("Select the target container for an item and click **Place**. Correct placements give +1 point; incorrect placements return the item to Available.")
+
+        # layout: available items on left, containers on right
+        containers = round_containers(st.session_state.round)
+        left_col, right_col = st.columns([1,2])
+
+        with left_col, span("sorter.available_widgets"):
+            st.subheader("Available Data")
+            page = page_controls(st.session_state)
+            if st.session_state.batch_mode:
+                for kind, message in st.session_state.pop("batch_feedback", []):
+                    if kind == "success":
+                        st.success(message, icon="✅")
+                    else:
+                        st.warning(message, icon="⚠️")
+                with st.form("batch_form"):
+                    for item_id in available_page(st.session_state, page):
+                        cols = st.columns([2,1])
+                        cols[0].markdown(f"**{st.session_state.round.items[item_id]}**")
+                        cols[1].selectbox("Container", options=containers, index=None, placeholder="Choose…", key=f"batch_{item_id}", label_visibility="collapsed")
+                    st.form_submit_button("✅ Submit all placements", on_click=submit_batch)
+            else:
+                # Show a small grid of available items and UI to place them quickly
+                # To make it fast, we show each item with a selectbox of target types and a Place button
+                for item_id in available_page(st.session_state, page):
+                    item = st.session_state.round.items[item_id]
+                    key_select = f"sel_{item_id}"
+                    key_btn = f"btn_{item_id}"
+                    cols = st.columns([2,1])
+                    cols[0].markdown(f"**{item}**")
+                    target = cols[1].selectbox("Container", options=containers, index=0, key=key_select, label_visibility="collapsed")
+                    place = st.button("Place", key=key_btn)
+                    if place:
+                        if place_item(st.session_state, item_id, target, get_event_log(), get_round_registry(),
+                                      get_difficulty_model()):
+                            st.success(f"Correct! +1 point ({item} → {target})", icon="✅")
+                        else:
+                            # wrong -> return to available (do nothing except flash)
+                            st.warning(f"Wrong container for {item}. It has been returned to Available.", icon="⚠️")
+                        # quick rerun to update timer/score display
+                        st.rerun()
+
+        with right_col:
+            st.subheader("Containers")
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                show_container(st.session_state, "🔢 Integers", "integers")
+            with c2:
+                show_container(st.session_state, "💧 Reals", "reals")
+            with c3:
+                show_container(st.session_state, "🔤 Characters", "characters")
+
+            c4, c5 = st.columns(2)
+            with c4:
+                show_container(st.session_state, "⚙️ Booleans", "booleans")
+            with c5:
+                show_container(st.session_state, "🧾 Strings", "strings")
+
+            extra = containers[len(CONTAINERS):]
+            if extra:
+                for col, container in zip(st.columns(len(extra)), extra):
+                    with col:
+                        show_container(st.session_state, CONTAINER_TITLES[container], container)
+
+    # --- Leaderboard (always visible) ---
+    st.markdown("---")
+    room = normalize_room(st.session_state.get("room_code"))
+    st.header(f"🏆 Leaderboard (Top 10){f' — room {room}' if room else ''}")
+    with span("sorter.leaderboard"):
+        leaderboard_version, leaderboard_df = load_leaderboard(10, room)
+    if leaderboard_df.empty:
+        st.info("No results yet. Play a round to generate leaderboard entries.")
+    else:
+        seen_room, seen_version = st.session_state.get("leaderboard_version", (room, leaderboard_version))
+        if seen_room == room and seen_version != leaderboard_version:
+            st.caption("🆕 Leaderboard updated.")
+        st.session_state.leaderboard_version = (room, leaderboard_version)
+        st.dataframe(leaderboard_df)
+    if st.toggle("🌍 Show the top 10 across all rooms", key="all_rooms"):
+        # merged from every room's own top 10 only when asked for
+        with span("sorter.all_rooms_leaderboard"):
+            st.dataframe(load_all_rooms_leaderboard(10), hide_index=True)
+    with st.expander("📊 Leaderboard cache stats"):
+        st.json(get_leaderboard_cache(room).stats())
+
+    # --- Download results (built only when the button is clicked) ---
+    with st.expander(f"⬇️ Download results{f' (room {room})' if room else ''}"), span("sorter.download"):
+        f1, f2, f3, f4 = st.columns(4)
+        name_filter = f1.text_input("Name contains", key="export_name").strip() or None
+        since_date = f2.date_input("From", value=None, key="export_since")
+        until_date = f3.date_input("To", value=None, key="export_until")
+        fmt = f4.selectbox("Format", list(FORMATS), key="export_format")
+        since = since_date.isoformat() if since_date else None
+        until = (until_date + datetime.timedelta(days=1)).isoformat() if until_date else None
+        if not room_exists(room):
+            st.caption("No results saved in this room yet.")
+        else:
+            st.download_button(
+                "⬇️ Download",
+                data=partial(export_bytes, get_store(room), fmt, name=name_filter, since=since, until=until),
+                file_name=export_file_name(fmt, name=name_filter, since=since, until=until),
+                mime=FORMATS[fmt][1],
+                key="export_download",
+                on_click="ignore",
+            )
+
+register_mode("timed_sorter", "Timed Sorter", "🧠", run)
@@ -0,0 +1,194 @@
+import atexit
+import collections
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Write-behind queue between save_result and the results stores. Journal
+# file format, one JSON object per line:
+#   {"seq"}                                             header, first line only
+#   {"seq", "room", "name", "score", "time", "ts"}      one per saved result
+# The header carries the seq counter across journal rewrites, so a seq is
+# never reused while a store still remembers it as applied.
+
+
+class ResultsWriteQueue:
+    # save() puts the result in an in-memory queue and returns its seq, so a
+    # game over never waits on the disk. A background thread takes whatever
+    # has been queued (a group commit), appends it to the journal with one
+    # write, and fsyncs; it starts at most one such commit every
+    # `fsync_interval` seconds, so a class finishing together costs one
+    # fsync, not one per student. durable(seq) turns true after that fsync:
+    # that is the acknowledgement. Each room's share is then inserted with one
+    # append_many() transaction that also stores the last seq it includes.
+    #
+    # On start, journal entries past their room's stored seq are inserted
+    # before anything else reads the stores, so an acknowledged result
+    # survives a crash at any point after its fsync. Once the journal passes
+    # `journal_bytes` and all of it is inserted, the touched stores are
+    # checkpointed and the journal is rewritten down to its header.
+    # One process per journal file.
+
+    def __init__(self, path, get_store, on_commit=None, fsync_interval=0.1, journal_bytes=1 << 20):
+        self.path = path
+        self.get_store = get_store  # room -> ResultsStore
+        self.on_commit = on_commit  # called as on_commit(room, rows) after each insert
+        self.fsync_interval = fsync_interval
+        self.journal_bytes = journal_bytes
+        self.batches = 0
+        self.max_batch = 0
+        self.errors = 0
+        self.replayed = 0
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._commit_lock = threading.Lock()  # one group commit at a time
+        self._unapplied = []  # fsynced to the journal, not yet in SQLite
+        self._touched = set()  # rooms inserted into since the last journal rewrite
+        self._last_sync = 0.0
+        self._torn = False
+        self._seq = self._replay()
+        self.durable_seq = self._seq
+        self._journal = open(path, "a", encoding="utf-8")
+        if self._torn:
+            self._journal.write("\n")  # so the next entry starts on its own line
+        self._thread = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            self._rewrite(0)
+            return 0
+        seq, entries = 0, []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                self._torn = not line.endswith("\n")
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # the partial last line of a crashed write, never fsynced or acknowledged
+                seq = max(seq, entry["seq"])
+                if "room" in entry:
+                    entries.append(entry)
+        applied = {}
+        for entry in entries:
+            room = entry["room"]
+            if room not in applied:
+                applied[room] = self.get_store(room).journal_seq()
+            if entry["seq"] > applied[room]:
+                self._unapplied.append(entry)
+        self.replayed = len(self._unapplied)
+        self._apply()
+        return seq
+
+    def save(self, name, score, time_taken, room=""):
+        # returns (seq, record); the record is what the store will hold
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self._cond:
+            self._seq += 1
+            seq = self._seq
+            self._queue.append({"seq": seq, "room": room, "name": name, "score": int(score),
+                                "time": int(time_taken), "ts": timestamp})
+            self._cond.notify()
+        return seq, {"Name": name, "Score": int(score), "TimeTaken(s)": int(time_taken), "Timestamp": timestamp}
+
+    def durable(self, seq):
+        return seq <= self.durable_seq
+
+    def wait(self, seq, timeout=None):
+        # block until seq is acknowledged (tests, load tests); False on timeout
+        with self._cond:
+            return self._cond.wait_for(lambda: self.durable(seq), timeout=timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # an insert that failed is retried on the next interval
+                self._cond.wait_for(lambda: self._queue, timeout=self.fsync_interval if self._unapplied else None)
+            delay = self._last_sync + self.fsync_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)  # let the rest of the group arrive
+            try:
+                self._commit()
+            except Exception:
+                self.errors += 1  # keep the writer alive; what is queued or unapplied is retried
+
+    def _commit(self):
+        with self._commit_lock:
+            with self._cond:
+                entries = list(self._queue)
+                self._queue.clear()
+            if entries:
+                self._last_sync = time.monotonic()
+                try:
+                    self._journal.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries))
+                    self._journal.flush()
+                    os.fsync(self._journal.fileno())
+                except OSError:
+                    self.errors += 1
+                    with self._cond:
+                        self._queue.extendleft(reversed(entries))  # not acknowledged; try again
+                    return
+                self.batches += 1
+                self.max_batch = max(self.max_batch, len(entries))
+                with self._cond:
+                    self.durable_seq = entries[-1]["seq"]
+                    self._cond.notify_all()
+                self._unapplied += entries
+            self._apply()
+            if not self._unapplied and self._journal.tell() > self.journal_bytes:
+                self._reset()
+
+    def _apply(self):
+        rooms = collections.defaultdict(list)
+        for entry in self._unapplied:
+            rooms[entry["room"]].append(entry)
+        for room, entries in rooms.items():
+            rows = [(e["name"], e["score"], e["time"], e["ts"]) for e in entries]
+            try:
+                self.get_store(room).append_many(rows, journal_seq=entries[-1]["seq"])
+            except (sqlite3.Error, OSError):
+                self.errors += 1
+                continue
+            # the rows are in; drop them at once so nothing below can insert them twice
+            inserted = {e["seq"] for e in entries}
+            self._unapplied = [e for e in self._unapplied if e["seq"] not in inserted]
+            self._touched.add(room)
+            if self.on_commit is not None:
+                try:
+                    self.on_commit(room, len(rows))
+                except Exception:
+                    self.errors += 1  # a failing hook must not stop the writer thread
+
+    def _reset(self):
+        # every journal entry is in SQLite; make that durable, then drop them
+        try:
+            for room in self._touched:
+                self.get_store(room).checkpoint()
+            self._journal.close()
+            self._rewrite(self.durable_seq)
+            self._touched.clear()
+        except (sqlite3.Error, OSError):
+            self.errors += 1  # the journal keeps its entries; replaying them is harmless
+        if self._journal.closed:
+            self._journal = open(self.path, "a", encoding="utf-8")
+
+    def _rewrite(self, seq):
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(json.dumps({"seq": seq}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.path + ".tmp", self.path)
+
+    def flush(self):
+        # commit everything saved so far before returning (tests, shutdown)
+        self._commit()
+
+    def stats(self):
+        with self._cond:
+            queued = len(self._queue)
+        return {"queued": queued, "unapplied": len(self._unapplied), "durable_seq": self.durable_seq,
+                "batches": self.batches, "max_batch": self.max_batch, "errors": self.errors,
+                "replayed": self.replayed}
@@ -0,0 +1,123 @@
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+import stdlib_array  # noqa: F401  (first: loads the real `array` module)
+
+from datatype_game.classifier import TYPE_NAMES
+from datatype_game.resources import (get_event_log, get_round_pool, get_round_registry, get_store,
+                                     get_results_queue, load_all_rooms_leaderboard, load_leaderboard, save_result)
+from datatype_game.sorter import CONTAINERS, available_ids, end_round, place_item, start_round, verify_round
+
+# Headless load generator for the timed sorter. Each simulated player is a
+# thread (Streamlit also runs one script thread per session) that drives the
+# same game functions sorter.run() uses, against the same process-wide store,
+# leaderboard and round pool. Nothing touches the network.
+
+
+class Latencies:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    def add(self, name, seconds):
+        with self._lock:
+            self.samples.setdefault(name, []).append(seconds)
+
+    def report(self):
+        print(f"{'operation':>16} {'count':>8} {'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}")
+        for name, samples in self.samples.items():
+            samples.sort()
+
+            def pct(p):
+                return samples[min(len(samples) - 1, int(len(samples) * p))] * 1e3
+
+            print(f"{name:>16} {len(samples):>8} {pct(0.50):7.2f} ms {pct(0.95):7.2f} ms {pct(0.99):7.2f} ms {samples[-1] * 1e3:7.2f} ms")
+
+
+def rerun(state, item_id, chosen):
+    # server-side data work of one app2 rerun after a Place click (see sorter.run)
+    place_item(state, item_id, chosen, get_event_log(), get_round_registry())
+    load_leaderboard(10, state["room"])
+
+
+def player(i, args, start_gate, stats):
+    rng = random.Random(i)
+    state = {"session_id": f"player{i}"}
+    room = f"room{i % args.rooms}" if args.rooms > 1 else ""  # players spread evenly over the classrooms
+    start_gate.wait()  # the whole class presses Start together
+    t0 = time.perf_counter()
+    start_round(state, get_round_pool("sorter", args.round_size).pop(seed=args.round_code), get_event_log(), f"player{i}", args.round_code, get_round_registry(), room)
+    stats.add("start", time.perf_counter() - t0)
+
+    deadline = time.monotonic() + args.duration
+    while available_ids(state) and time.monotonic() < deadline:
+        time.sleep(rng.expovariate(1 / args.think))
+        item_id = available_ids(state)[0]
+        correct = TYPE_NAMES[state["round"].types[item_id]]
+        chosen = correct if rng.random() < args.accuracy else rng.choice([c for c in CONTAINERS if c != correct])
+        t0 = time.perf_counter()
+        rerun(state, item_id, chosen)
+        stats.add("rerun", time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        load_leaderboard(10, room)
+        stats.add("leaderboard read", time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    score, seconds = verify_round(state, get_round_registry())
+    stats.add("verify", time.perf_counter() - t0)
+    assert score == state["score"], (score, state["score"])
+    t0 = time.perf_counter()
+    seq = save_result(f"player{i}", score, seconds, room)
+    end_round(state, get_event_log(), seconds)
+    stats.add("save", time.perf_counter() - t0)
+    get_results_queue().wait(seq)
+    stats.add("save durable", time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a class of players hitting the timed sorter at once")
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--think", type=float, default=0.5, help="mean seconds between a player's placements")
+    parser.add_argument("--accuracy", type=float, default=0.8, help="chance a placement is correct")
+    parser.add_argument("--duration", type=int, default=60, help="round length in seconds")
+    parser.add_argument("--round-code", default="", help="give every player the same round")
+    parser.add_argument("--round-size", type=int, default=20, help="items per round")
+    parser.add_argument("--rooms", type=int, default=1, help="classrooms to split the players over, each with its own store")
+    parser.add_argument("--history", type=int, default=0, help="results to pre-load into the scratch store")
+    args = parser.parse_args()
+
+    # run against a scratch results store, never the real one
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            get_store().append_many((f"past{n}", n % 21, n % 61, "2025-01-01 00:00:00") for n in range(args.history))
+            stats = Latencies()
+            start_gate = threading.Barrier(args.players)
+            threads = [threading.Thread(target=player, args=(i, args, start_gate, stats)) for i in range(args.players)]
+            t0 = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            print(f"{args.players} players finished in {time.perf_counter() - t0:.1f} s")
+            stats.report()
+            get_results_queue().flush()
+            print(f"results queue: {get_results_queue().stats()}")
+            if args.rooms > 1:
+                t0 = time.perf_counter()
+                best = load_all_rooms_leaderboard(10)
+                print(f"all-rooms top 10 merged in {(time.perf_counter() - t0) * 1e3:.2f} ms, best {best.iloc[0].to_dict()}")
+            get_event_log().flush()
+            print(f"event log: {get_event_log().stats()}")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import collections
+import sys
+import time
+
+import stdlib_array  # noqa: F401  (first: loads the real `array` module)
+
+from datatype_game.event_log import read_events
+from datatype_game.round_pool import round_from_items
+from datatype_game.sorter import available_ids, container_items, place_item, round_containers, start_round
+
+# Rebuilds timed sorter rounds from the event log (events.jsonl), by feeding
+# the logged placements back through the same place_item() the game uses.
+
+
+def load_rounds(path):
+    rounds = collections.OrderedDict()
+    for event in read_events(path):
+        round_id = event.get("round")
+        if round_id is None:
+            continue  # placed before pressing Start; there is no round to replay
+        r = rounds.setdefault(round_id, {"start": None, "places": [], "end": None})
+        if event["kind"] == "place":
+            r["places"].append(event)
+        else:
+            r[event["kind"]] = event
+    return rounds
+
+
+def replay(r):
+    # returns the rebuilt state and one (event, correct, score, available) row per placement
+    state = {}
+    start_round(state, round_from_items(r["start"]["items"]))
+    steps = []
+    for event in sorted(r["places"], key=lambda e: e["seq"]):
+        item_id = event.get("item_id")
+        if item_id is None:
+            # logs written before item ids: take the first available item with that value
+            item_id = next(i for i in available_ids(state) if state["round"].items[i] == event["item"])
+        correct = place_item(state, item_id, event["chosen"])
+        steps.append((event, correct, state["score"], len(available_ids(state))))
+    return state, steps
+
+
+def cmd_list(args):
+    rounds = load_rounds(args.events)
+    print(f"{'round':>12} {'started':>19} {'name':>16} {'code':>8} {'placed':>7} {'score':>6}")
+    for round_id, r in rounds.items():
+        if r["start"] is None:
+            continue
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(r["start"]["ts"]))
+        score = r["end"]["score"] if r["end"] else sum(e["correct"] for e in r["places"])
+        print(f"{round_id:>12} {started:>19} {r['start']['name'][:16]:>16} {r['start']['code'][:8]:>8} {len(r['places']):>7} {score:>6}")
+
+
+def cmd_show(args):
+    rounds = load_rounds(args.events)
+    r = rounds.get(args.round)
+    if r is None or r["start"] is None:
+        sys.exit(f"round {args.round!r} has no start event in {args.events}")
+    start = r["start"]
+    print(f"round {args.round}  player {start['name']!r}  code {start['code']!r}  session {start['session']}")
+    print(f"items: {', '.join(start['items'])}")
+    state, steps = replay(r)
+    print(f"{'seq':>4} {'after':>9} {'item':>8} {'chosen':>11} {'detected':>11} {'':>6} {'score':>6} {'left':>5}")
+    for event, correct, score, left in steps:
+        print(f"{event['seq']:>4} {event['latency_ms'] / 1e3:7.2f} s {event['item']:>8} {event['chosen']:>11} "
+              f"{event['detected']:>11} {'ok' if correct else 'WRONG':>6} {score:>6} {left:>5}")
+    for container in round_containers(state["round"]):
+        print(f"{container:>11}: {container_items(state, container)}")
+    print(f"{'available':>11}: {[state['round'].items[i] for i in available_ids(state)]}")
+    if r["end"]:
+        logged = r["end"]["score"]
+        print(f"replayed score {state['score']}, logged score {logged}" + ("" if logged == state["score"] else "  MISMATCH"))
+    else:
+        print(f"replayed score {state['score']} (round has no end event)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List and replay timed sorter rounds from the event log")
+    parser.add_argument("--events", default="events.jsonl")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("list", help="one line per logged round")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("show", help="rebuild one round placement by placement")
+    p.add_argument("round")
+    p.set_defaults(func=cmd_show)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
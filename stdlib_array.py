@@ -0,0 +1,16 @@
+import os
+import sys
+
+# array.py (the grid game) sits in the project root and shadows the stdlib
+# `array` module that socket/pyarrow/streamlit import. The command-line tools
+# started from here (bench.py, loadtest.py, replay.py) import this module
+# before anything else, which loads the real one with the root left off
+# sys.path and then puts the path back as it was.
+
+_root = os.path.dirname(os.path.abspath(__file__))
+_path = list(sys.path)
+sys.path[:] = [p for p in _path if os.path.abspath(p or os.curdir) != _root]
+try:
+    import array  # noqa: E402,F401
+finally:
+    sys.path[:] = _path
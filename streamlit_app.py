@@ -0,0 +1,7 @@
+import streamlit as st
+
+from datatype_game import navigation
+
+# One Streamlit app serving every game mode: one warm import, one set of caches.
+st.set_page_config(page_title="Data Type Games", layout="wide")
+navigation().run()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Run from the project root as `pytest tests` (not `python -m pytest`, which
+# puts the root, and its array.py, ahead of the stdlib `array` module).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import stdlib_array  # noqa: E402,F401
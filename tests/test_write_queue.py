@@ -0,0 +1,31 @@
+from datatype_game.results_store import ResultsStore
+from datatype_game.write_queue import ResultsWriteQueue
+
+
+def _queue(tmp_path, on_commit):
+    store = ResultsStore(str(tmp_path / "results.db"))
+    queue = ResultsWriteQueue(str(tmp_path / "results.journal"), lambda room: store, on_commit=on_commit,
+                              fsync_interval=0.01)
+    return store, queue
+
+
+def test_failing_on_commit_hook_keeps_the_writer_running(tmp_path):
+    calls = []
+
+    def hook(room, rows):
+        calls.append(rows)
+        raise RuntimeError("leaderboard hook failed")
+
+    store, queue = _queue(tmp_path, hook)
+    first, _ = queue.save("ana", 20, 30)
+    assert queue.wait(first, timeout=5)
+    second, _ = queue.save("ben", 18, 40)
+    assert queue.wait(second, timeout=5)
+    queue.flush()
+    queue.flush()
+
+    assert store.count() == 2  # each row inserted once, although every hook call raised
+    assert store.journal_seq() == second
+    assert queue.stats()["unapplied"] == 0
+    assert queue.errors == len(calls) >= 2
+    assert queue._thread.is_alive()